@@ -1,7 +1,8 @@
 """Main orchestrator function for reading complete NMR experiments."""
 
 from pathlib import Path
-from typing import Union, List, Optional, Dict, Any, Literal
+from typing import Union, List, Optional, Dict, Any, Literal, Callable
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from rich.console import Console
 
@@ -46,6 +47,162 @@ def merge_options(defaults: dict, provided: Optional[dict]) -> dict:
     return result
 
 
+def _map_paths(func: Callable, paths: List[Path], n_workers: int = 1) -> list:
+    """
+    Apply a single-path reader to every path, optionally in a thread pool.
+
+    Results are returned in the same order as ``paths``. Reading is mostly
+    file I/O and NumPy/SciPy work that releases the GIL, so threads scale
+    without the cost of pickling DataFrames back from worker processes.
+    """
+    if n_workers is None or n_workers <= 1 or len(paths) <= 1:
+        return [func(p) for p in paths]
+
+    with ThreadPoolExecutor(max_workers=min(n_workers, len(paths))) as executor:
+        return list(executor.map(func, paths))
+
+
+def _read_params_wide(exp_path: Path, file: Path, prefix: str) -> Optional[pd.DataFrame]:
+    """Read one acqus/procs file and reshape it to a single wide row."""
+    if not file.exists():
+        return None
+
+    parms = read_params(file)
+    if parms is None:
+        return None
+
+    parms['path'] = str(exp_path)
+    # Reshape from long to wide
+    parms_wide = parms.pivot(index='path', columns='name', values='value')
+    parms_wide.columns = [f'{prefix}.{col}' for col in parms_wide.columns]
+    return parms_wide.reset_index()
+
+
+def _read_qc_one(exp_path: Path) -> Optional[Dict[str, Any]]:
+    """Check one experiment for a readable QC report."""
+    folder_path = exp_path / "pdata" / "1"
+    # Find QC report files
+    qc_files = list(folder_path.glob("*qc_report*.xml"))
+
+    # Prefer 1_1_0 version if available
+    if any("1_1_0.xml" in str(f) for f in qc_files):
+        qc_files = [f for f in qc_files if "1_1_0.xml" in str(f)]
+
+    if not qc_files:
+        return None
+
+    qc = read_qc(qc_files[0])
+    if qc is None:
+        return None
+
+    # Create a flat dictionary from QC data
+    return {'path': str(exp_path)}
+
+
+def _read_spec_one(exp_path: Path, procno: int, spec_opts: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Read the spectrum of one experiment, looking up its ERETIC factor if needed."""
+    spec_opts = spec_opts.copy()
+
+    # Find ERETIC factor if not provided
+    if 'eretic' not in spec_opts:
+        # Look in expno + 0 folder (ANPC structure)
+        exp_str = str(exp_path)
+        eretic_path = Path(exp_str[:-1] + "0")
+
+        eretic_factor = 1
+
+        if (eretic_path / "QuantFactorSample.xml").exists():
+            eretic = read_eretic(eretic_path / "QuantFactorSample.xml")
+            if eretic is not None:
+                eretic_factor = eretic['ereticFactor'].iloc[0]
+
+        elif (eretic_path / "pdata" / "1" / "eretic_file.xml").exists():
+            eretic = read_eretic_f80(eretic_path / "pdata" / "1" / "eretic_file.xml")
+            if eretic is not None:
+                eretic_factor = eretic['samOneMolInt'].iloc[0]
+
+        spec_opts['eretic'] = eretic_factor
+
+        # Removed verbose per-experiment logging
+        # if eretic_factor == 1:
+        #     console.print(f"[red]readExperiment >> ereticFactor set to 1: {eretic_path}[/red]")
+
+    spec = read_spectrum(exp_path, procno, procs=True, options=spec_opts)
+
+    if spec is None:
+        return None
+
+    return {'path': str(exp_path), 'spec': [spec]}
+
+
+def _read_report_wide(exp_path: Path, pattern: str, reader: Callable,
+                      columns: str, values: str) -> Optional[pd.DataFrame]:
+    """Read one lipo/pacs report (preferring version 1_1_0) as a single wide row."""
+    folder_path = exp_path / "pdata" / "1"
+    files = list(folder_path.glob(pattern))
+
+    # Prefer 1_1_0 version
+    if any("1_1_0" in str(f) for f in files):
+        files = [f for f in files if "1_1_0" in str(f)]
+
+    if not files:
+        return None
+
+    report = reader(files[0])
+    if report is None:
+        return None
+
+    df = report['data'].copy()
+    df['path'] = str(exp_path)
+    # Pivot to wide format
+    df_wide = df.pivot(index='path', columns=columns, values=values)
+    df_wide.columns = [f'value.{col}' for col in df_wide.columns]
+    return df_wide.reset_index()
+
+
+def _read_quant_one(exp_path: Path) -> Optional[pd.DataFrame]:
+    """Read the highest-priority quant report of one experiment as a single wide row."""
+    folder_path = exp_path / "pdata" / "1"
+
+    # Priority order for quant files
+    priority = [
+        "plasma_quant_report_2_1_0.xml",
+        "plasma_quant_report.xml",
+        "urine_quant_report_e_1_2_0.xml",
+        "urine_quant_report_e_ver_1_0.xml",
+        "urine_quant_report_e.xml",
+        "urine_quant_report_b_ver_1_0.xml",
+        "urine_quant_report_b.xml",
+        "urine_quant_report_ne_ver_1_0.xml",
+        "urine_quant_report_ne.xml"
+    ]
+
+    # Find all quant files
+    quant_files = list(folder_path.glob("*quant*.xml"))
+
+    # Pick highest priority match
+    chosen = None
+    for priority_file in priority:
+        matches = [f for f in quant_files if priority_file in str(f)]
+        if matches:
+            chosen = matches[0]
+            break
+
+    if not chosen:
+        return None
+
+    quant = read_quant(chosen)
+    if quant is None:
+        return None
+
+    quant_data = quant['data'].copy()
+    quant_data['path'] = str(exp_path)
+    # Pivot to wide format
+    df_wide = quant_data.pivot(index='path', columns='name', values='rawConc')
+    df_wide.columns = [f'value.{col}' for col in df_wide.columns]
+    return df_wide.reset_index()
+
+
 def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
                    opts: Optional[Dict[str, Any]] = None) -> Dict[str, pd.DataFrame]:
     """
@@ -68,6 +225,9 @@ def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
             Processing number to read
         - specOpts : dict
             Options for spectrum reading (uncalibrate, fromTo, length_out, eretic)
+        - nWorkers : int, default=1
+            Number of threads used to read experiments concurrently.
+            Results keep the order of ``expname``.
 
     Returns
     -------
@@ -112,6 +272,7 @@ def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
         'what': ["acqus", "procs", "qc", "title", "eretic", "spec",
                  "lipo", "quant", "pacs", "all", "specOnly"],
         'procno': 1,
+        'nWorkers': 1,
         'specOpts': {
             'uncalibrate': False,
             'fromTo': (-0.1, 10),
@@ -122,6 +283,7 @@ def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
     # Merge options
     opts = merge_options(default_options, opts)
     what = opts['what']
+    n_workers = opts.get('nWorkers', 1)
 
     # Convert single path to list
     if isinstance(expname, (str, Path)):
@@ -133,22 +295,11 @@ def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
 
     # Read acqus
     if "acqus" in what or "all" in what:
-        lst = []
-        for i, exp_path in enumerate(expname):
-            # Removed verbose per-experiment progress print
-            # console.print(f"Reading: {i+1} / {len(expname)}", end="\r")
-
-            path = exp_path / "acqus"
-            if path.exists():
-                parms = read_params(path)
-
-                if parms is not None:
-                    parms['path'] = str(exp_path)
-                    # Reshape from long to wide
-                    parms_wide = parms.pivot(index='path', columns='name', values='value')
-                    parms_wide.columns = [f'acqus.{col}' for col in parms_wide.columns]
-                    parms_wide = parms_wide.reset_index()
-                    lst.append(parms_wide)
+        lst = _map_paths(
+            lambda exp_path: _read_params_wide(exp_path, exp_path / "acqus", 'acqus'),
+            expname, n_workers
+        )
+        lst = [df for df in lst if df is not None]
 
         if lst:
             # Find common columns
@@ -169,22 +320,11 @@ def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
 
     # Read procs
     if "procs" in what or "all" in what:
-        lst = []
-        for i, exp_path in enumerate(expname):
-            # Removed verbose per-experiment progress print
-            # console.print(f"Reading: {i+1} / {len(expname)}", end="\r")
-
-            path = exp_path / "pdata" / "1" / "procs"
-            if path.exists():
-                parms = read_params(path)
-
-                if parms is not None:
-                    parms['path'] = str(exp_path)
-                    # Reshape from long to wide
-                    parms_wide = parms.pivot(index='path', columns='name', values='value')
-                    parms_wide.columns = [f'procs.{col}' for col in parms_wide.columns]
-                    parms_wide = parms_wide.reset_index()
-                    lst.append(parms_wide)
+        lst = _map_paths(
+            lambda exp_path: _read_params_wide(exp_path, exp_path / "pdata" / "1" / "procs", 'procs'),
+            expname, n_workers
+        )
+        lst = [df for df in lst if df is not None]
 
         if lst:
             # Find common columns
@@ -204,26 +344,7 @@ def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
 
     # Read QC
     if "qc" in what or "all" in what:
-        lst = []
-        for i, exp_path in enumerate(expname):
-            # Removed verbose per-experiment progress print
-            # console.print(f"Reading: {i+1} / {len(expname)}", end="\r")
-
-            folder_path = exp_path / "pdata" / "1"
-            # Find QC report files
-            qc_files = list(folder_path.glob("*qc_report*.xml"))
-
-            # Prefer 1_1_0 version if available
-            if any("1_1_0.xml" in str(f) for f in qc_files):
-                qc_files = [f for f in qc_files if "1_1_0.xml" in str(f)]
-
-            if qc_files:
-                qc = read_qc(qc_files[0])
-                if qc is not None:
-                    qc_data = qc['data']
-                    # Create a flat dictionary from QC data
-                    qc_dict = {'path': str(exp_path)}
-                    lst.append(qc_dict)
+        lst = [qc for qc in _map_paths(_read_qc_one, expname, n_workers) if qc is not None]
 
         res['qc'] = pd.DataFrame(lst) if lst else pd.DataFrame()
 
@@ -282,38 +403,12 @@ def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
     procno = opts.get('procno', 1)
 
     if "spec" in what or "all" in what or "specOnly" in what:
-        lst = []
-        for exp_path in expname:
-            spec_opts = opts.get('specOpts', {}).copy()
-
-            # Find ERETIC factor if not provided
-            if 'eretic' not in spec_opts:
-                # Look in expno + 0 folder (ANPC structure)
-                exp_str = str(exp_path)
-                eretic_path = Path(exp_str[:-1] + "0")
-
-                eretic_factor = 1
-
-                if (eretic_path / "QuantFactorSample.xml").exists():
-                    eretic = read_eretic(eretic_path / "QuantFactorSample.xml")
-                    if eretic is not None:
-                        eretic_factor = eretic['ereticFactor'].iloc[0]
-
-                elif (eretic_path / "pdata" / "1" / "eretic_file.xml").exists():
-                    eretic = read_eretic_f80(eretic_path / "pdata" / "1" / "eretic_file.xml")
-                    if eretic is not None:
-                        eretic_factor = eretic['samOneMolInt'].iloc[0]
-
-                spec_opts['eretic'] = eretic_factor
-
-                # Removed verbose per-experiment logging
-                # if eretic_factor == 1:
-                #     console.print(f"[red]readExperiment >> ereticFactor set to 1: {eretic_path}[/red]")
-
-            spec = read_spectrum(exp_path, procno, procs=True, options=spec_opts)
-
-            if spec is not None:
-                lst.append({'path': str(exp_path), 'spec': [spec]})
+        spec_opts = opts.get('specOpts', {})
+        lst = _map_paths(
+            lambda exp_path: _read_spec_one(exp_path, procno, spec_opts),
+            expname, n_workers
+        )
+        lst = [spec for spec in lst if spec is not None]
 
         res['spec'] = pd.DataFrame(lst)
 
@@ -325,36 +420,13 @@ def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
 
     # Read lipo
     if "lipo" in what or "all" in what:
-        lst = []
-        for exp_path in expname:
-            folder_path = exp_path / "pdata" / "1"
-            lipo_files = list(folder_path.glob("*lipo*.xml"))
+        lipo_dfs = _map_paths(
+            lambda exp_path: _read_report_wide(exp_path, "*lipo*.xml", read_lipo, 'id', 'value'),
+            expname, n_workers
+        )
+        lipo_dfs = [df for df in lipo_dfs if df is not None]
 
-            # Prefer 1_1_0 version
-            if any("1_1_0" in str(f) for f in lipo_files):
-                lipo_files = [f for f in lipo_files if "1_1_0" in str(f)]
-
-            if lipo_files:
-                lipoproteins = read_lipo(lipo_files[0])
-                if lipoproteins is not None:
-                    lipo_data = lipoproteins['data'].copy()
-                    lipo_data['path'] = str(exp_path)
-                    lst.append({'data': lipo_data})
-
-        if lst:
-            # Reshape lipo data from long to wide
-            lipo_dfs = []
-            for item in lst:
-                df = item['data']
-                # Pivot to wide format
-                df_wide = df.pivot(index='path', columns='id', values='value')
-                df_wide.columns = [f'value.{col}' for col in df_wide.columns]
-                df_wide = df_wide.reset_index()
-                lipo_dfs.append(df_wide)
-
-            res['lipo'] = pd.concat(lipo_dfs, ignore_index=True) if lipo_dfs else pd.DataFrame()
-        else:
-            res['lipo'] = pd.DataFrame()
+        res['lipo'] = pd.concat(lipo_dfs, ignore_index=True) if lipo_dfs else pd.DataFrame()
 
         if len(res['lipo']) == 0:
             console.print("[yellow]readExperiment >> 0 found lipo[/yellow]")
@@ -363,36 +435,13 @@ def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
 
     # Read PACS
     if "pacs" in what or "all" in what:
-        lst = []
-        for exp_path in expname:
-            folder_path = exp_path / "pdata" / "1"
-            pacs_files = list(folder_path.glob("*pacs*.xml"))
-
-            # Prefer 1_1_0 version
-            if any("1_1_0" in str(f) for f in pacs_files):
-                pacs_files = [f for f in pacs_files if "1_1_0" in str(f)]
-
-            if pacs_files:
-                pacs = read_pacs(pacs_files[0])
-                if pacs is not None:
-                    pacs_data = pacs['data'].copy()
-                    pacs_data['path'] = str(exp_path)
-                    lst.append({'data': pacs_data})
+        pacs_dfs = _map_paths(
+            lambda exp_path: _read_report_wide(exp_path, "*pacs*.xml", read_pacs, 'name', 'conc_v'),
+            expname, n_workers
+        )
+        pacs_dfs = [df for df in pacs_dfs if df is not None]
 
-        if lst:
-            # Reshape PACS data from long to wide
-            pacs_dfs = []
-            for item in lst:
-                df = item['data']
-                # Pivot to wide format
-                df_wide = df.pivot(index='path', columns='name', values='conc_v')
-                df_wide.columns = [f'value.{col}' for col in df_wide.columns]
-                df_wide = df_wide.reset_index()
-                pacs_dfs.append(df_wide)
-
-            res['pacs'] = pd.concat(pacs_dfs, ignore_index=True) if pacs_dfs else pd.DataFrame()
-        else:
-            res['pacs'] = pd.DataFrame()
+        res['pacs'] = pd.concat(pacs_dfs, ignore_index=True) if pacs_dfs else pd.DataFrame()
 
         if len(res['pacs']) == 0:
             console.print("[yellow]readExperiment >> 0 found pacs[/yellow]")
@@ -401,55 +450,9 @@ def read_experiment(expname: Union[str, Path, List[Union[str, Path]]],
 
     # Read quant
     if "quant" in what or "all" in what:
-        lst = []
-        for exp_path in expname:
-            folder_path = exp_path / "pdata" / "1"
-
-            # Priority order for quant files
-            priority = [
-                "plasma_quant_report_2_1_0.xml",
-                "plasma_quant_report.xml",
-                "urine_quant_report_e_1_2_0.xml",
-                "urine_quant_report_e_ver_1_0.xml",
-                "urine_quant_report_e.xml",
-                "urine_quant_report_b_ver_1_0.xml",
-                "urine_quant_report_b.xml",
-                "urine_quant_report_ne_ver_1_0.xml",
-                "urine_quant_report_ne.xml"
-            ]
-
-            # Find all quant files
-            quant_files = list(folder_path.glob("*quant*.xml"))
-
-            # Pick highest priority match
-            chosen = None
-            for priority_file in priority:
-                matches = [f for f in quant_files if priority_file in str(f)]
-                if matches:
-                    chosen = matches[0]
-                    break
-
-            if chosen:
-                quant = read_quant(chosen)
-                if quant is not None:
-                    quant_data = quant['data'].copy()
-                    quant_data['path'] = str(exp_path)
-                    lst.append({'data': quant_data})
+        quant_dfs = [df for df in _map_paths(_read_quant_one, expname, n_workers) if df is not None]
 
-        if lst:
-            # Reshape quant data from long to wide
-            quant_dfs = []
-            for item in lst:
-                df = item['data']
-                # Pivot to wide format
-                df_wide = df.pivot(index='path', columns='name', values='rawConc')
-                df_wide.columns = [f'value.{col}' for col in df_wide.columns]
-                df_wide = df_wide.reset_index()
-                quant_dfs.append(df_wide)
-
-            res['quant'] = pd.concat(quant_dfs, ignore_index=True) if quant_dfs else pd.DataFrame()
-        else:
-            res['quant'] = pd.DataFrame()
+        res['quant'] = pd.concat(quant_dfs, ignore_index=True) if quant_dfs else pd.DataFrame()
 
         if len(res['quant']) == 0:
             console.print("[yellow]readExperiment >> 0 found quant[/yellow]")
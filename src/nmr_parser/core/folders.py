@@ -5,7 +5,6 @@ from typing import Union, Optional, Dict, Any, List
 import pandas as pd
 from rich.console import Console
 from rich.prompt import Prompt
-from collections import Counter
 
 from .parameters import read_param
 from ..processing.utils import clean_names
@@ -148,11 +147,9 @@ def scan_folder(folder: Union[str, Path],
 
     # Print summary
     if len(exp_df) > 0:
-        exp_pulprog_counts = Counter(
-            exp_df['EXP'] + "@" + exp_df['PULPROG']
-        )
-        for combo, count in exp_pulprog_counts.items():
-            console.print(f"[blue]scanFolder >> {combo}: {count}[/blue]")
+        exp_pulprog_counts = exp_df.groupby(['EXP', 'PULPROG'], sort=False).size()
+        for (exp_name, pulprog), count in exp_pulprog_counts.items():
+            console.print(f"[blue]scanFolder >> {exp_name}@{pulprog}: {count}[/blue]")
     else:
         console.print("[yellow]No experiments matched filters[/yellow]")
 
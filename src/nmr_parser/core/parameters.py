@@ -151,7 +151,8 @@ def read_params(file: Union[str, Path]) -> Optional[pd.DataFrame]:
         console.print(f"[yellow]readParams >> {file} file is AMIX[/yellow]")
         return None
 
-    content = []
+    names = []
+    values = []
     counter = 0
     filename = file.name
 
@@ -173,11 +174,8 @@ def read_params(file: Union[str, Path]) -> Optional[pd.DataFrame]:
                 clean_value = re.sub(r'\$\$', '', clean_value)
                 clean_value = re.sub(r'\s+', ' ', clean_value)
 
-                content.append({
-                    'path': filename,
-                    'name': param_name,
-                    'value': clean_value
-                })
+                names.append(param_name)
+                values.append(clean_value)
 
         # Get audit info ($$)
         elif line.startswith('$$ '):
@@ -211,15 +209,12 @@ def read_params(file: Union[str, Path]) -> Optional[pd.DataFrame]:
 
             # Add metadata to content
             if all([date, time, timezone, instrument]):
-                content.extend([
-                    {'path': filename, 'name': 'instrumentDate', 'value': date},
-                    {'path': filename, 'name': 'instrumentTime', 'value': time},
-                    {'path': filename, 'name': 'instrumentTimeZone', 'value': timezone},
-                    {'path': filename, 'name': 'instrument', 'value': instrument}
-                ])
+                names.extend(['instrumentDate', 'instrumentTime', 'instrumentTimeZone', 'instrument'])
+                values.extend([date, time, timezone, instrument])
 
             if dpath:
-                content.append({'path': filename, 'name': 'dpath', 'value': dpath})
+                names.append('dpath')
+                values.append(dpath)
 
         # Get parameters (##$)
         elif line.startswith('##$'):
@@ -233,28 +228,26 @@ def read_params(file: Union[str, Path]) -> Optional[pd.DataFrame]:
                     counter += 1
                     if counter < len(lines):
                         vector_line = lines[counter]
-                        values = vector_line.split()
-                        for i, v in enumerate(values):
-                            content.append({
-                                'path': filename,
-                                'name': f'{param_name}_{i}',
-                                'value': v
-                            })
+                        vector_values = vector_line.split()
+                        names.extend(f'{param_name}_{i}' for i in range(len(vector_values)))
+                        values.extend(vector_values)
                 else:
                     # Clean value
                     clean_value = value.replace('<', '').replace('>', '')
-                    content.append({
-                        'path': filename,
-                        'name': param_name,
-                        'value': clean_value
-                    })
+                    names.append(param_name)
+                    values.append(clean_value)
 
         counter += 1
 
-    if not content:
+    if not names:
         return None
 
-    df = pd.DataFrame(content)
+    # Build columns directly rather than from one dict per parameter
+    df = pd.DataFrame({
+        'path': [filename] * len(names),
+        'name': names,
+        'value': values
+    })
 
     # Replace empty values with None
     df['value'] = df['value'].replace('', None)
@@ -5,6 +5,7 @@ This module migrates the parseNMR.R functionality to Python, preserving all
 research decisions while replacing the dataElement structure with parquet files.
 """
 
+import os
 from pathlib import Path
 from typing import Union, Optional, Dict, Any, List, Tuple
 import pandas as pd
@@ -12,6 +13,7 @@ import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 import logging
 from rich.console import Console
@@ -81,6 +83,7 @@ def parse_nmr(
             - fromTo : tuple (default: (-0.1, 10))
             - length_out : int (default: 44079)
             - im : bool (default: False) - read imaginary part
+            - interp : str (default: 'cubic') - 'cubic' or 'linear' regridding
 
         - outputDir : str or Path
             Output directory for parquet files (default: '.')
@@ -88,6 +91,19 @@ def parse_nmr(
         - noWrite : bool
             If True, return DataFrames without writing files (default: False)
 
+        - compression : str
+            Parquet compression codec: 'zstd', 'snappy', 'gzip', 'lz4' or
+            'none' (default: 'zstd'). 'none' is fastest on local SSDs.
+
+        - precision : str
+            Floating point precision of the spectra in the data matrix:
+            'float32' or 'float64' (default: 'float32'). spcglyc always
+            reads spectra at float64 so the integrals keep full precision.
+
+        - nWorkers : int
+            Number of threads used to read experiments concurrently
+            (default: number of CPUs). Set to 1 to read serially.
+
         - verbosity : str
             Logging verbosity: 'prod', 'info', or 'debug' (default: 'info')
 
@@ -105,6 +121,10 @@ def parse_nmr(
     - {run_id}_params.parquet : Acquisition/processing parameters
     - {run_id}_variables.parquet : Variable definitions
 
+    Rows of the data, metadata and params files are grouped by sample
+    type, one row group per type, keeping acquisition order within each
+    type. The returned DataFrames keep acquisition order.
+
     For spcglyc, additional files:
     - {run_id}_tsp.parquet : TSP reference region
     - {run_id}_spc_region.parquet : Full SPC region
@@ -154,11 +174,15 @@ def parse_nmr(
             'uncalibrate': False,
             'fromTo': (-0.1, 10),
             'length_out': 44079,
-            'im': False
+            'im': False,
+            'interp': 'cubic'
         },
         'EXP': '',
         'outputDir': '.',
         'noWrite': False,
+        'compression': 'zstd',
+        'precision': 'float32',
+        'nWorkers': os.cpu_count() or 1,
         'verbosity': 'info'
     }
 
@@ -179,6 +203,7 @@ def parse_nmr(
         opts['what'] = ['spec']  # Read spec first
         spcglyc = True
         opts['specOpts']['uncalibrate'] = True
+        opts['precision'] = 'float64'  # Integrate at full precision
     else:
         spcglyc = False
 
@@ -216,23 +241,34 @@ def parse_nmr(
     var_names = None
     data_type = None
 
+    # Read the data source, acqus and QC in a single read_experiment call
+    source = next((READ_SOURCES[w] for w in READ_SOURCES if w in opts['what']), None)
+    read_what = ([source] if source else []) + ['acqus', 'qc']
+    paths = loe['dataPath'].tolist()
+    log.debug(f"Reading {', '.join(read_what)} from {len(paths)} paths")
+    experiments = read_experiment(
+        paths,
+        opts={'what': read_what, 'specOpts': opts['specOpts'], 'nWorkers': opts['nWorkers']}
+    )
+
     # Read spectra (lines 234-278)
     if 'spec' in opts['what']:
         log.step("Reading spectra")
-        data_matrix, var_names, data_type = _read_spectra(loe, opts, log)
+        ppm = _ppm_axis(opts['specOpts'])
+        data_matrix, var_names, data_type = _read_spectra(experiments, loe, opts, ppm, log)
 
     # Handle other data types
     elif 'brxlipo' in opts['what']:
         log.step("Reading lipoprotein data")
-        data_matrix, var_names, data_type = _read_brxlipo(loe, opts, log)
+        data_matrix, var_names, data_type = _read_brxlipo(experiments, opts, log)
 
     elif 'brxpacs' in opts['what']:
         log.step("Reading PACS data")
-        data_matrix, var_names, data_type = _read_brxpacs(loe, opts, log)
+        data_matrix, var_names, data_type = _read_brxpacs(experiments, opts, log)
 
     elif 'brxsm' in opts['what']:
         log.step("Reading small molecule data")
-        data_matrix, var_names, data_type = _read_brxsm(loe, opts, log)
+        data_matrix, var_names, data_type = _read_brxsm(experiments, opts, log)
 
     if data_matrix is None:
         raise ValueError("No data was read. Check input parameters.")
@@ -240,11 +276,6 @@ def parse_nmr(
     # Apply spcglyc calculations (lines 280-359)
     if spcglyc:
         log.step("Calculating spcglyc biomarkers")
-        ppm = np.linspace(
-            opts['specOpts']['fromTo'][0],
-            opts['specOpts']['fromTo'][1],
-            opts['specOpts']['length_out']
-        )
         data_matrix, var_names, extra_data = _calculate_spcglyc(
             data_matrix, ppm, loe, log
         )
@@ -256,10 +287,10 @@ def parse_nmr(
     # ========================================================================
 
     log.step("Reading acquisition parameters", LogLevel.INFO)
-    acqus_data = _read_acqus_params(loe['dataPath'].tolist(), log)
+    acqus_data = _read_acqus_params(experiments, log)
 
     log.step("Checking for IVDr QC data", LogLevel.INFO)
-    qc_data, is_ivdr = _read_qc_data(loe['dataPath'].tolist(), log)
+    qc_data, is_ivdr = _read_qc_data(experiments, log)
 
     # ========================================================================
     # MERGING AND ALIGNMENT
@@ -279,7 +310,7 @@ def parse_nmr(
     loe['sample_key'] = sample_keys
 
     # 1. Data matrix
-    data_df = pd.DataFrame(data_matrix, columns=var_names)
+    data_df = pd.DataFrame(data_matrix, columns=var_names, copy=False)
     data_df.insert(0, 'sample_key', sample_keys)
     data_df = data_df.set_index('sample_key')
 
@@ -326,7 +357,7 @@ def parse_nmr(
         file_name = _generate_file_name(opts)
 
         # Write parquet files
-        _write_parquet_files(result, file_name, output_dir, log)
+        _write_parquet_files(result, file_name, output_dir, log, opts['compression'])
 
         # Add output info to summary
         summary_data["Output dir"] = str(output_dir)
@@ -386,12 +417,15 @@ def _process_local_folder(folder: Union[str, Path], opts: Dict, log) -> pd.DataF
     # Check for ANPC sampleID in USERA2 (lines 192-217)
     if not lof['USERA2'].isna().all() and lof['USERA2'].iloc[0] != '':
         log.info("ANPC sampleID (USERA2) found")
-        sample_ids = lof['USERA2'].tolist()
         # Normalize QC labels (lines 196-200)
-        sample_ids = [s.replace('SLTR', 'sltr') for s in sample_ids]
-        sample_ids = [s.replace('LTR', 'ltr') for s in sample_ids]
-        sample_ids = [s.replace('PQC', 'pqc') for s in sample_ids]
-        sample_ids = [s.replace('QC', 'qc') for s in sample_ids]
+        sample_ids = (
+            lof['USERA2']
+            .str.replace('SLTR', 'sltr', regex=False)
+            .str.replace('LTR', 'ltr', regex=False)
+            .str.replace('PQC', 'pqc', regex=False)
+            .str.replace('QC', 'qc', regex=False)
+            .tolist()
+        )
     else:
         # Use interactive selection or timestamps
         log.warning("No USERA2 found. Using folder structure for sample IDs")
@@ -419,102 +453,125 @@ def _classify_sample_types(loe: pd.DataFrame, log) -> pd.DataFrame:
     """
     loe = loe.copy()
 
-    type_counts = {'sltr': 0, 'ltr': 0, 'pqc': 0, 'qc': 0, 'sample': 0}
-
-    for idx, row in loe.iterrows():
-        sample_id = row['sampleID'].lower()
-
-        # Priority order matters!
-        if 'sltr' in sample_id:
-            loe.at[idx, 'sampleType'] = 'sltr'
-            type_counts['sltr'] += 1
-        elif sample_id.startswith('ltr'):
-            loe.at[idx, 'sampleType'] = 'ltr'
-            type_counts['ltr'] += 1
-        elif sample_id.startswith('pqc'):
-            loe.at[idx, 'sampleType'] = 'pqc'
-            type_counts['pqc'] += 1
-        elif sample_id.startswith('qc'):
-            loe.at[idx, 'sampleType'] = 'qc'
-            type_counts['qc'] += 1
-        else:
-            type_counts['sample'] += 1
+    sample_ids = loe['sampleID'].str.lower()
+
+    # Priority order matters! np.select picks the first matching condition
+    sample_types = np.select(
+        [
+            sample_ids.str.contains('sltr', regex=False).to_numpy(dtype=bool),
+            sample_ids.str.startswith('ltr').to_numpy(dtype=bool),
+            sample_ids.str.startswith('pqc').to_numpy(dtype=bool),
+            sample_ids.str.startswith('qc').to_numpy(dtype=bool),
+        ],
+        ['sltr', 'ltr', 'pqc', 'qc'],
+        default='sample'
+    )
+
+    # Unmatched rows keep whatever sampleType they already had
+    is_typed = sample_types != 'sample'
+    loe.loc[is_typed, 'sampleType'] = sample_types[is_typed]
+
+    type_counts = {
+        stype: int((sample_types == stype).sum())
+        for stype in ['sltr', 'ltr', 'pqc', 'qc', 'sample']
+    }
 
     # Log classification results at DEBUG level
     log.debug(f"Sample classification: {type_counts}")
 
+    # Tube size is fixed per path, flag it once for later stages
+    loe['is3mm'] = _is_3mm(loe)
+
     return loe
 
 
+def _is_3mm(loe: pd.DataFrame) -> np.ndarray:
+    """3mm tube flag per sample, from the is3mm column when already set."""
+    if 'is3mm' in loe.columns:
+        return loe['is3mm'].to_numpy(dtype=bool)
+    return loe['dataPath'].str.contains('3mm', case=False, regex=False).to_numpy(dtype=bool)
+
+
 def _make_unique(names: List[str]) -> List[str]:
     """Make names unique by appending _1, _2, etc. to duplicates."""
-    seen = {}
-    result = []
+    if len(names) == 0:
+        return []
 
-    for name in names:
-        if name not in seen:
-            seen[name] = 0
-            result.append(name)
-        else:
-            seen[name] += 1
-            result.append(f"{name}_{seen[name]}")
+    names = pd.Series(names, dtype=object)
 
-    return result
+    # Occurrence number of each name so far: 0 for the first, 1 for the second...
+    occurrence = names.groupby(names, sort=False).cumcount()
+    suffix = ('_' + occurrence.astype(str)).where(occurrence > 0, '')
+
+    return (names + suffix).tolist()
 
 
 # ============================================================================
 # DATA READING FUNCTIONS
 # ============================================================================
 
+# read_experiment source read for each data type, in priority order
+READ_SOURCES = {
+    'spec': 'spec',
+    'brxlipo': 'lipo',
+    'brxpacs': 'pacs',
+    'brxsm': 'quant',
+}
+
+# Real and complex matrix dtypes for each supported spectra precision
+SPECTRA_DTYPES = {
+    'float32': (np.float32, np.complex64),
+    'float64': (np.float64, np.complex128),
+}
+
+
+def _ppm_axis(spec_opts: Dict) -> np.ndarray:
+    """Common ppm grid the spectra are interpolated onto."""
+    return np.linspace(spec_opts['fromTo'][0], spec_opts['fromTo'][1], spec_opts['length_out'])
+
+
+def _ppm_names(ppm: np.ndarray) -> List[str]:
+    """Variable names of a ppm axis, formatted like str(float)."""
+    return ppm.astype(str).tolist()
+
+
 def _read_spectra(
+    experiments: Dict[str, pd.DataFrame],
     loe: pd.DataFrame,
     opts: Dict,
+    ppm: np.ndarray,
     log
 ) -> Tuple[np.ndarray, List[str], str]:
     """Read NMR spectra (lines 234-278)."""
-    paths = loe['dataPath'].tolist()
-
-    log.debug(f"Reading spectra from {len(paths)} paths")
-
-    # Read all experiments
-    experiments = read_experiment(
-        paths,
-        opts={'what': ['spec'], 'specOpts': opts['specOpts']}
-    )
-
-    if 'spec' not in experiments or experiments['spec'] is None:
+    if 'spec' not in experiments or experiments['spec'] is None or len(experiments['spec']) == 0:
         raise ValueError("No spectra found")
 
-    spec_df = experiments['spec']
+    # Each cell of 'spec' is a list with one SpectrumResult
+    spec_frames = [spec[0].spec for spec in experiments['spec']['spec']]
 
-    # Extract spectra into matrix
-    n_samples = len(spec_df)
-    n_points = opts['specOpts']['length_out']
-
-    # Check if reading imaginary part too
-    if opts['specOpts'].get('im', False):
-        # Complex data
-        data_matrix = np.zeros((n_samples, n_points), dtype=np.complex128)
-        for i, row in spec_df.iterrows():
-            spec_result = row['spec'][0]  # spec is a list with one SpectrumResult
-            spec_data = spec_result.spec  # Get the DataFrame from SpectrumResult
-            data_matrix[i, :] = spec_data['y'].values + 1j * spec_data['yi'].values
-    else:
-        # Real data only
-        data_matrix = np.zeros((n_samples, n_points))
-        for i, row in spec_df.iterrows():
-            spec_result = row['spec'][0]  # spec is a list with one SpectrumResult
-            spec_data = spec_result.spec  # Get the DataFrame from SpectrumResult
-            data_matrix[i, :] = spec_data['y'].values
-
-    # Generate PPM axis
-    ppm = np.linspace(
-        opts['specOpts']['fromTo'][0],
-        opts['specOpts']['fromTo'][1],
-        opts['specOpts']['length_out']
+    if opts['precision'] not in SPECTRA_DTYPES:
+        raise ValueError(
+            f"Unknown precision '{opts['precision']}', "
+            f"expected one of {list(SPECTRA_DTYPES)}"
+        )
+    real_dtype, complex_dtype = SPECTRA_DTYPES[opts['precision']]
+    read_im = opts['specOpts'].get('im', False)
+
+    # Fill a preallocated matrix row by row so no float64 copy of the
+    # whole matrix is made when storing at float32
+    n_points = len(spec_frames[0])
+    data_matrix = np.empty(
+        (len(spec_frames), n_points),
+        dtype=complex_dtype if read_im else real_dtype
     )
+    for i, spec_data in enumerate(spec_frames):
+        if read_im:
+            data_matrix[i].real = spec_data['y'].to_numpy()
+            data_matrix[i].imag = spec_data['yi'].to_numpy()
+        else:
+            data_matrix[i] = spec_data['y'].to_numpy()
 
-    var_names = [str(p) for p in ppm]
+    var_names = _ppm_names(ppm)
     data_type = 'NMR'
 
     # Log spectrum grid info once (not per spectrum!)
@@ -533,67 +590,112 @@ def _read_spectra(
     return data_matrix, var_names, data_type
 
 
-def _read_brxlipo(loe: pd.DataFrame, opts: Dict, log) -> Tuple[np.ndarray, List[str], str]:
-    """Read Bruker lipoprotein data (lines 361-374)."""
-    paths = loe['dataPath'].tolist()
-    log.debug(f"Reading brxlipo from {len(paths)} paths")
+def _value_columns(data: pd.DataFrame) -> Tuple[np.ndarray, List[str]]:
+    """
+    Matrix of the 'value.*' columns of a Bruker report and their variable names.
+
+    Columns are selected with a boolean mask on the column index, so the
+    matrix is taken in one block instead of column by column.
+    """
+    is_value = data.columns.str.startswith('value.')
+    data_matrix = data.loc[:, is_value].to_numpy()
+    var_names = data.columns[is_value].str.slice(len('value.')).tolist()
+    return data_matrix, var_names
 
-    experiments = read_experiment(paths, opts={'what': ['lipo']})
 
+def _read_brxlipo(
+    experiments: Dict[str, pd.DataFrame],
+    opts: Dict,
+    log
+) -> Tuple[np.ndarray, List[str], str]:
+    """Read Bruker lipoprotein data (lines 361-374)."""
     if 'lipo' not in experiments or experiments['lipo'] is None:
         raise ValueError("No brxlipo data found")
 
-    lipo_data = experiments['lipo']
-    # Extract value columns
-    value_cols = [c for c in lipo_data.columns if c.startswith('value.')]
-    data_matrix = lipo_data[value_cols].values
-    var_names = [c.replace('value.', '') for c in value_cols]
+    data_matrix, var_names = _value_columns(experiments['lipo'])
 
     log.debug(f"Extracted {len(var_names)} lipoprotein variables")
     opts['method'] = 'brxlipo'
     return data_matrix, var_names, 'QUANT'
 
 
-def _read_brxpacs(loe: pd.DataFrame, opts: Dict, log) -> Tuple[np.ndarray, List[str], str]:
+def _read_brxpacs(
+    experiments: Dict[str, pd.DataFrame],
+    opts: Dict,
+    log
+) -> Tuple[np.ndarray, List[str], str]:
     """Read Bruker PACS data (lines 376-389)."""
-    paths = loe['dataPath'].tolist()
-    log.debug(f"Reading brxpacs from {len(paths)} paths")
-
-    experiments = read_experiment(paths, opts={'what': ['pacs']})
-
     if 'pacs' not in experiments or experiments['pacs'] is None:
         raise ValueError("No brxpacs data found")
 
-    pacs_data = experiments['pacs']
-    value_cols = [c for c in pacs_data.columns if c.startswith('value.')]
-    data_matrix = pacs_data[value_cols].values
-    var_names = [c.replace('value.', '') for c in value_cols]
+    data_matrix, var_names = _value_columns(experiments['pacs'])
 
     log.debug(f"Extracted {len(var_names)} PACS variables")
     opts['method'] = 'brxpacs'
     return data_matrix, var_names, 'QUANT'
 
 
-def _read_brxsm(loe: pd.DataFrame, opts: Dict, log) -> Tuple[np.ndarray, List[str], str]:
+def _read_brxsm(
+    experiments: Dict[str, pd.DataFrame],
+    opts: Dict,
+    log
+) -> Tuple[np.ndarray, List[str], str]:
     """Read Bruker small molecule quant data (lines 391-404)."""
-    paths = loe['dataPath'].tolist()
-    log.debug(f"Reading brxsm from {len(paths)} paths")
-
-    experiments = read_experiment(paths, opts={'what': ['quant']})
-
     if 'quant' not in experiments or experiments['quant'] is None:
         raise ValueError("No brxsm data found")
 
-    quant_data = experiments['quant']
-    value_cols = [c for c in quant_data.columns if c.startswith('value.')]
-    data_matrix = quant_data[value_cols].values
-    var_names = [c.replace('value.', '') for c in value_cols]
+    data_matrix, var_names = _value_columns(experiments['quant'])
 
     log.debug(f"Extracted {len(var_names)} small molecule variables")
     opts['method'] = 'brxsm'
     return data_matrix, var_names, 'QUANT'
 
 
+def _ppm_slice(ppm: np.ndarray, ppm_min: float, ppm_max: float,
+               inclusive: bool = False) -> slice:
+    """
+    Index range of an ascending ppm axis lying between ppm_min and ppm_max.
+
+    Equivalent to the boolean mask ``(ppm > ppm_min) & (ppm < ppm_max)``
+    (or ``>=``/``<=`` when inclusive) but found by binary search, so the
+    region can be taken as a contiguous slice.
+    """
+    if inclusive:
+        lo = np.searchsorted(ppm, ppm_min, side='left')
+        hi = np.searchsorted(ppm, ppm_max, side='right')
+    else:
+        lo = np.searchsorted(ppm, ppm_min, side='right')
+        hi = np.searchsorted(ppm, ppm_max, side='left')
+    return slice(int(lo), int(hi))
+
+
+def _integrate_regions(spectra: np.ndarray, ppm: np.ndarray,
+                       bounds: List[Tuple[float, float]]) -> np.ndarray:
+    """
+    Sum each spectrum over several open ppm intervals in a single pass.
+
+    The interval edges split the axis into disjoint segments that are
+    summed once with np.add.reduceat; each (possibly overlapping) region
+    is then the sum of its segments. Returns an (n_samples, n_regions)
+    array of raw sums (not yet multiplied by the point spacing).
+    """
+    slices = [_ppm_slice(ppm, ppm_min, ppm_max) for ppm_min, ppm_max in bounds]
+
+    # reduceat needs strictly increasing, in-range segment starts
+    edges = np.unique([edge for sl in slices for edge in (sl.start, sl.stop)])
+    edges = edges[edges < spectra.shape[1]]
+    if len(edges) == 0:
+        return np.zeros((spectra.shape[0], len(bounds)))
+
+    segments = np.add.reduceat(spectra, edges, axis=1)
+
+    sums = np.empty((spectra.shape[0], len(bounds)))
+    for i, sl in enumerate(slices):
+        first, last = np.searchsorted(edges, [sl.start, sl.stop])
+        sums[:, i] = segments[:, first:last].sum(axis=1)
+    return sums
+
+
 def _calculate_spcglyc(
     spectra: np.ndarray,
     ppm: np.ndarray,
@@ -607,76 +709,67 @@ def _calculate_spcglyc(
 
     This function implements the calculation of glycoprotein and
     supramolecular phospholipid composite biomarkers from NMR spectra.
+    The ppm axis must be ascending, as built by parse_nmr.
     """
+    if ppm[-1] < ppm[0]:
+        raise ValueError("spcglyc requires an ascending ppm axis")
+
     # 1. Trim specific PPM regions (lines 282-289)
     log.debug("Trimming PPM regions: water (4.6-4.85), baseline (<0.2), high (>10.0)")
-    exclude_idx = (
-        ((ppm >= 4.6) & (ppm <= 4.85)) |  # Water region
-        ((ppm >= ppm.min()) & (ppm <= 0.2)) |  # Baseline
-        (ppm >= 10.0)  # High PPM
-    )
+    keep_idx = np.ones(len(ppm), dtype=bool)
+    keep_idx[_ppm_slice(ppm, 4.6, 4.85, inclusive=True)] = False  # Water region
+    keep_idx[:np.searchsorted(ppm, 0.2, side='right')] = False  # Baseline
+    keep_idx[np.searchsorted(ppm, 10.0, side='left'):] = False  # High PPM
 
-    trimmed_spectra = spectra[:, ~exclude_idx]
-    trimmed_ppm = ppm[~exclude_idx]
+    trimmed_spectra = spectra[:, keep_idx]
+    trimmed_ppm = ppm[keep_idx]
     dw = trimmed_ppm[1] - trimmed_ppm[0]  # Delta PPM
 
     # 2. Check for 180° flip (lines 293-299)
     # CRITICAL: If sum of 3.2-3.3 region is negative, flip spectrum
-    region_3_2_3_3 = trimmed_spectra[:, (trimmed_ppm >= 3.2) & (trimmed_ppm <= 3.3)]
+    region_3_2_3_3 = trimmed_spectra[:, _ppm_slice(trimmed_ppm, 3.2, 3.3, inclusive=True)]
     flip_idx = np.where(region_3_2_3_3.sum(axis=1) < 0)[0]
 
     if len(flip_idx) > 0:
         log.debug(f"Flipping {len(flip_idx)} spectra (180° phase correction)")
-        trimmed_spectra[flip_idx, :] = -trimmed_spectra[flip_idx, :]
+        # trimmed_spectra is a private copy, so the flipped rows are negated
+        # through it in place
+        trimmed_spectra[flip_idx] *= -1
 
     # 3. Extract specific regions for output (lines 301-316)
+    # Regions are copied so the returned frames don't keep the full matrix alive
     # TSP region (0-0.5 ppm)
-    tsp_region = spectra[:, (ppm >= ppm.min()) & (ppm <= 0.5)]
-    tsp_ppm = ppm[(ppm >= ppm.min()) & (ppm <= 0.5)]
+    tsp_slice = slice(0, int(np.searchsorted(ppm, 0.5, side='right')))
+    tsp_region = spectra[:, tsp_slice].copy()
+    tsp_ppm = ppm[tsp_slice]
 
     # SPC region (3.18-3.32 ppm)
-    spc_region = trimmed_spectra[:, (trimmed_ppm > 3.18) & (trimmed_ppm < 3.32)]
-    spc_ppm = trimmed_ppm[(trimmed_ppm > 3.18) & (trimmed_ppm < 3.32)]
+    spc_slice = _ppm_slice(trimmed_ppm, 3.18, 3.32)
+    spc_region = trimmed_spectra[:, spc_slice].copy()
+    spc_ppm = trimmed_ppm[spc_slice]
 
     # Glyc region (2.050-2.118 ppm)
-    glyc_region = trimmed_spectra[:, (trimmed_ppm > 2.050) & (trimmed_ppm < 2.118)]
-    glyc_ppm = trimmed_ppm[(trimmed_ppm > 2.050) & (trimmed_ppm < 2.118)]
+    glyc_slice = _ppm_slice(trimmed_ppm, 2.050, 2.118)
+    glyc_region = trimmed_spectra[:, glyc_slice].copy()
+    glyc_ppm = trimmed_ppm[glyc_slice]
 
     # 4. Calculate biomarkers by integration (lines 319-347)
     # CRITICAL: All integrations use sum * dw
-    def integrate_region(ppm_min: float, ppm_max: float) -> np.ndarray:
-        """Integrate spectrum in PPM range."""
-        mask = (trimmed_ppm > ppm_min) & (trimmed_ppm < ppm_max)
-        return trimmed_spectra[:, mask].sum(axis=1) * dw
-
-    # SPC biomarkers
-    spc_all = integrate_region(3.18, 3.32)
-    spc3 = integrate_region(3.262, 3.3)
-    spc2 = integrate_region(3.236, 3.262)
-    spc1 = integrate_region(3.2, 3.236)
-
-    # Glycoprotein biomarkers
-    glyc_all = integrate_region(2.050, 2.118)
-    glyc_a = integrate_region(2.050, 2.089)
-    glyc_b = integrate_region(2.089, 2.118)
-
-    # Albumin proxies
-    alb1 = integrate_region(0.2, 0.7)
-    alb2 = integrate_region(6.0, 10.0)
+    (spc_all, spc3, spc2, spc1,
+     glyc_all, glyc_a, glyc_b,
+     alb1, alb2) = _integrate_regions(trimmed_spectra, trimmed_ppm, [
+        # SPC biomarkers
+        (3.18, 3.32), (3.262, 3.3), (3.236, 3.262), (3.2, 3.236),
+        # Glycoprotein biomarkers
+        (2.050, 2.118), (2.050, 2.089), (2.089, 2.118),
+        # Albumin proxies
+        (0.2, 0.7), (6.0, 10.0),
+    ]).T * dw
 
     # 5. Calculate ratios (lines 349-350)
     spc3_2 = spc3 / spc2
     spc_glyc = spc_all / glyc_all
 
-    # 6. Apply 3mm tube correction (lines 356-357)
-    # CRITICAL: Divide by 2 for 3mm tubes
-    is_3mm = loe['dataPath'].str.contains('3mm', case=False).values
-    if is_3mm.any():
-        log.debug(f"Applying 3mm tube correction to {is_3mm.sum()} samples")
-        for arr in [spc_all, spc3, spc2, spc1, glyc_all, glyc_a, glyc_b,
-                    alb1, alb2, spc3_2, spc_glyc]:
-            arr[is_3mm] = arr[is_3mm] / 2
-
     # Create output matrix
     data_matrix = np.column_stack([
         spc_all, spc3, spc2, spc1,
@@ -685,6 +778,13 @@ def _calculate_spcglyc(
         spc3_2, spc_glyc
     ])
 
+    # 6. Apply 3mm tube correction (lines 356-357)
+    # CRITICAL: Divide by 2 for 3mm tubes (all biomarkers, ratios included)
+    is_3mm = _is_3mm(loe)
+    if is_3mm.any():
+        log.debug(f"Applying 3mm tube correction to {is_3mm.sum()} samples")
+        data_matrix[is_3mm, :] /= 2
+
     var_names = [
         'SPC_All', 'SPC3', 'SPC2', 'SPC1',
         'Glyc_All', 'GlycA', 'GlycB',
@@ -693,20 +793,18 @@ def _calculate_spcglyc(
     ]
 
     # Store extra data for output
+    # The regions are already private copies, wrap them without another
     extra_data = {
-        'tsp': pd.DataFrame(tsp_region, columns=[str(p) for p in tsp_ppm]),
-        'spc_region': pd.DataFrame(spc_region, columns=[str(p) for p in spc_ppm]),
-        'glyc_region': pd.DataFrame(glyc_region, columns=[str(p) for p in glyc_ppm])
+        'tsp': pd.DataFrame(tsp_region, columns=_ppm_names(tsp_ppm), copy=False),
+        'spc_region': pd.DataFrame(spc_region, columns=_ppm_names(spc_ppm), copy=False),
+        'glyc_region': pd.DataFrame(glyc_region, columns=_ppm_names(glyc_ppm), copy=False)
     }
 
     return data_matrix, var_names, extra_data
 
 
-def _read_acqus_params(paths: List[str], log) -> pd.DataFrame:
+def _read_acqus_params(experiments: Dict[str, pd.DataFrame], log) -> pd.DataFrame:
     """Read acquisition parameters (lines 409)."""
-    log.debug(f"Reading acquisition parameters from {len(paths)} paths")
-    experiments = read_experiment(paths, opts={'what': ['acqus']})
-
     if 'acqus' not in experiments:
         log.warning("No acquisition parameters found")
         return pd.DataFrame()
@@ -714,11 +812,11 @@ def _read_acqus_params(paths: List[str], log) -> pd.DataFrame:
     return experiments['acqus']
 
 
-def _read_qc_data(paths: List[str], log) -> Tuple[Optional[pd.DataFrame], bool]:
+def _read_qc_data(
+    experiments: Dict[str, pd.DataFrame],
+    log
+) -> Tuple[Optional[pd.DataFrame], bool]:
     """Read QC data and check for IVDr (lines 411-422)."""
-    log.debug(f"Checking for QC data in {len(paths)} paths")
-    experiments = read_experiment(paths, opts={'what': ['qc']})
-
     if 'qc' not in experiments or experiments['qc'] is None:
         log.info("Non-IVDr data (no QC found)")
         return None, False
@@ -743,56 +841,83 @@ def _merge_data_sources(
 
     Lines 425-545 in R code. CRITICAL for data integrity.
     """
+    # Rows of the matrix are matched to loe by position, so a matrix that
+    # lost or gained rows (e.g. a spectrum that failed to read) can't be
+    # attributed to samples
+    if len(data_matrix) != len(loe):
+        raise ValueError(
+            f"Data matrix has {len(data_matrix)} rows for {len(loe)} experiments, "
+            f"cannot align it with the list of experiments"
+        )
+
     # Get all paths
-    loe_paths = set(loe['dataPath'].tolist())
+    loe_paths = pd.Index(loe['dataPath'])
+
+    # Find intersection (sources without data don't restrict it)
+    intersection = loe_paths.unique()
 
     if len(acqus_data) > 0:
-        acqus_paths = set(acqus_data['path'].tolist())
-    else:
-        acqus_paths = loe_paths
+        intersection = intersection.intersection(pd.Index(acqus_data['path']))
 
     if qc_data is not None and len(qc_data) > 0:
-        qc_paths = set(qc_data['path'].tolist())
-    else:
-        qc_paths = loe_paths
-
-    # Find intersection
-    intersection = loe_paths & acqus_paths & qc_paths
+        intersection = intersection.intersection(pd.Index(qc_data['path']))
 
     # Log excluded paths
-    excluded = loe_paths - intersection
-    if excluded:
+    excluded = loe_paths.difference(intersection)
+    if len(excluded) > 0:
         log.warning(f"Excluded {len(excluded)} paths (not present in all data sources)")
-        for path in list(excluded)[:5]:  # Show first 5 at DEBUG level
+        for path in excluded[:5]:  # Show first 5 at DEBUG level
             log.detail(path)
 
-    # Filter all data sources
-    loe_idx = loe['dataPath'].isin(intersection)
-    data_matrix = data_matrix[loe_idx, :]
-    loe = loe[loe_idx].reset_index(drop=True)
+    # Filter all data sources, leaving untouched any that lose no rows
+    # (the usual case) so the data matrix is not copied for nothing.
+    # The matrix is aligned with loe (checked above), so rows are taken
+    # by position.
+    loe_idx = loe['dataPath'].isin(intersection).to_numpy()
+    if not loe_idx.all():
+        data_matrix = data_matrix[np.flatnonzero(loe_idx), :]
+        loe = loe[loe_idx].reset_index(drop=True)
 
     if len(acqus_data) > 0:
-        acqus_data = acqus_data[acqus_data['path'].isin(intersection)].reset_index(drop=True)
+        acqus_data = _filter_paths(acqus_data, intersection)
 
     if qc_data is not None and len(qc_data) > 0:
-        qc_data = qc_data[qc_data['path'].isin(intersection)].reset_index(drop=True)
+        qc_data = _filter_paths(qc_data, intersection)
 
     return data_matrix, loe, acqus_data, qc_data
 
 
+def _filter_paths(df: pd.DataFrame, paths: pd.Index) -> pd.DataFrame:
+    """Rows of df whose path is in paths, with a fresh index."""
+    keep = df['path'].isin(paths).to_numpy()
+    if not keep.all():
+        df = df[keep]
+    return df.reset_index(drop=True)
+
+
 # ============================================================================
 # OUTPUT CREATION FUNCTIONS
 # ============================================================================
 
 def _generate_sample_keys(loe: pd.DataFrame) -> List[str]:
-    """Generate unique sample keys for joining."""
-    keys = []
-    for idx, row in loe.iterrows():
-        # Use sampleID + hash of path for uniqueness
-        path_hash = hashlib.md5(row['dataPath'].encode()).hexdigest()[:8]
-        key = f"{row['sampleID']}_{path_hash}"
-        keys.append(key)
-    return keys
+    """
+    Generate unique sample keys for joining.
+
+    Keys are sampleID + the first 8 hex digits of the MD5 of the path.
+    MD5 is kept so keys stay identical to earlier runs; each distinct
+    path is hashed once.
+    """
+    codes, paths = pd.factorize(loe['dataPath'])
+    path_hashes = np.array(
+        [hashlib.md5(path.encode()).hexdigest()[:8] for path in paths],
+        dtype=object
+    )[codes]
+    keys = loe['sampleID'].astype(str).to_numpy(dtype=object) + '_' + path_hashes
+    return keys.tolist()
+
+
+# tube_type categories, indexed by the 3mm flag
+TUBE_TYPES = ['5mm', '3mm']
 
 
 def _create_metadata_df(
@@ -802,27 +927,35 @@ def _create_metadata_df(
     is_ivdr: bool
 ) -> pd.DataFrame:
     """Create metadata DataFrame."""
-    # Detect tube type from path
-    tube_types = []
-    for path in loe['dataPath']:
-        if '3mm' in path.lower():
-            tube_types.append('3mm')
-        else:
-            tube_types.append('5mm')
+    n_samples = len(loe)
 
-    metadata = pd.DataFrame({
-        'sample_key': loe['sample_key'],
-        'data_path': loe['dataPath'],
-        'sample_id': loe['sampleID'],
-        'sample_type': loe['sampleType'],
-        'experiment': loe['experiment'],
-        'nmr_folder_id': loe.get('nmrFolderId', [None] * len(loe)),
+    # Tube type from the 3mm flag set during sample classification,
+    # the flag itself being the category code
+    tube_types = pd.Categorical.from_codes(
+        _is_3mm(loe).astype(np.int8), categories=TUBE_TYPES
+    )
+
+    # Run-level values repeat on every row: store each as a one-category
+    # column rather than broadcasting the string N times
+    run_values = {
         'project_name': opts['projectName'],
         'cohort_name': opts['cohortName'],
         'run_name': opts['runName'],
         'sample_matrix_type': opts['sampleMatrixType'],
         'method': opts['method'],
         'data_type': data_type,
+    }
+    metadata = pd.DataFrame({
+        'sample_key': loe['sample_key'],
+        'data_path': loe['dataPath'],
+        'sample_id': loe['sampleID'],
+        'sample_type': loe['sampleType'],
+        'experiment': loe['experiment'],
+        'nmr_folder_id': loe.get('nmrFolderId', [None] * n_samples),
+        **{
+            col: _constant_categorical(value, n_samples)
+            for col, value in run_values.items()
+        },
         'is_ivdr': is_ivdr,
         'tube_type': tube_types,
         'created_at': datetime.now(),
@@ -832,47 +965,68 @@ def _create_metadata_df(
     return metadata.set_index('sample_key')
 
 
+def _constant_categorical(value: Any, n: int) -> pd.Categorical:
+    """Length-n categorical repeating value (all missing if value is None)."""
+    if value is None:
+        return pd.Categorical.from_codes(np.full(n, -1, dtype=np.int8), categories=[])
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[value])
+
+
+# Columns of the long-format params table
+PARAMS_COLUMNS = ['sample_key', 'param_name', 'param_value', 'param_source']
+
+
 def _create_params_df(
     sample_keys: List[str],
     acqus_data: pd.DataFrame,
     qc_data: Optional[pd.DataFrame]
 ) -> pd.DataFrame:
     """Create parameters DataFrame in long format."""
-    params_list = []
+    params_blocks = []
 
     # Add acqus parameters
     if len(acqus_data) > 0:
-        for idx, key in enumerate(sample_keys):
-            row = acqus_data.iloc[idx]
-            for col in acqus_data.columns:
-                if col != 'path':
-                    params_list.append({
-                        'sample_key': key,
-                        'param_name': col,
-                        'param_value': row[col],
-                        'param_source': 'acqus'
-                    })
+        params_blocks.append(_params_long(acqus_data, sample_keys, 'acqus'))
 
     # Add QC parameters
     if qc_data is not None and len(qc_data) > 0:
-        for idx, key in enumerate(sample_keys):
-            row = qc_data.iloc[idx]
-            for col in qc_data.columns:
-                if col != 'path':
-                    params_list.append({
-                        'sample_key': key,
-                        'param_name': col,
-                        'param_value': row[col],
-                        'param_source': 'qc'
-                    })
-
-    if not params_list:
-        return pd.DataFrame(columns=['sample_key', 'param_name', 'param_value', 'param_source'])
-
-    params_df = pd.DataFrame(params_list)
+        params_blocks.append(_params_long(qc_data, sample_keys, 'qc'))
+
+    if not params_blocks:
+        return pd.DataFrame(columns=PARAMS_COLUMNS)
+
+    # Concatenate column by column and wrap once, no intermediate frames
+    params_df = pd.DataFrame(
+        {col: np.concatenate(arrays) for col, arrays in zip(PARAMS_COLUMNS, zip(*params_blocks))},
+        copy=False
+    )
     return params_df.set_index(['sample_key', 'param_name'])
 
 
+def _params_long(
+    source_data: pd.DataFrame,
+    sample_keys: List[str],
+    source: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Melt one parameter source (one row per sample) into long format.
+
+    Returns one object array per PARAMS_COLUMNS column. Rows are ordered
+    sample by sample, each sample's parameters in column order. The values
+    are read as one row-major block, so no per-sample row lookup or
+    reordering pass is needed.
+    """
+    wide = source_data.drop(columns=['path'], errors='ignore')
+    n_samples, n_params = wide.shape
+
+    return (
+        np.repeat(np.asarray(sample_keys, dtype=object), n_params),
+        np.tile(wide.columns.to_numpy(dtype=object), n_samples),
+        wide.to_numpy(dtype=object).ravel(),
+        np.full(n_samples * n_params, source, dtype=object),
+    )
+
+
 def _create_variables_df(
     var_names: List[str],
     data_type: str,
@@ -883,12 +1037,12 @@ def _create_variables_df(
     n_vars = len(var_names)
 
     # Generate var_ids
-    var_ids = [f"var_{i:05d}" for i in range(n_vars)]
+    var_ids = np.char.mod('var_%05d', np.arange(n_vars))
 
     if spcglyc:
         # Special case for spcglyc biomarkers
-        var_type = ['biomarker'] * n_vars
-        var_unit = ['ratio'] * n_vars
+        var_type = 'biomarker'
+        var_unit = 'ratio'
         descriptions = [
             'Total SPC (3.18-3.32 ppm)',
             'SPC subregion 3 (3.262-3.3 ppm)',
@@ -902,42 +1056,46 @@ def _create_variables_df(
             'SPC3/SPC2 ratio',
             'SPC/Glyc ratio'
         ]
-        ppm_centers = [
+        ppm_centers = np.array([
             3.25, 3.281, 3.249, 3.218,
             2.084, 2.0695, 2.1035,
             0.45, 8.0,
             np.nan, np.nan
-        ]
-        ppm_mins = [3.18, 3.262, 3.236, 3.2, 2.050, 2.050, 2.089, 0.2, 6.0, np.nan, np.nan]
-        ppm_maxs = [3.32, 3.3, 3.262, 3.236, 2.118, 2.089, 2.118, 0.7, 10.0, np.nan, np.nan]
+        ])
+        ppm_mins = np.array([3.18, 3.262, 3.236, 3.2, 2.050, 2.050, 2.089, 0.2, 6.0, np.nan, np.nan])
+        ppm_maxs = np.array([3.32, 3.3, 3.262, 3.236, 2.118, 2.089, 2.118, 0.7, 10.0, np.nan, np.nan])
 
     elif data_type == 'NMR':
         # Spectral data
-        var_type = ['ppm'] * n_vars
-        var_unit = ['ppm'] * n_vars
-        descriptions = [f'NMR intensity at {v} ppm' for v in var_names]
-        ppm_centers = [float(v) for v in var_names]
-        ppm_mins = [np.nan] * n_vars
-        ppm_maxs = [np.nan] * n_vars
+        names = np.asarray(var_names, dtype=object)
+        var_type = 'ppm'
+        var_unit = 'ppm'
+        descriptions = 'NMR intensity at ' + names + ' ppm'
+        ppm_centers = np.asarray(var_names, dtype=np.float64)
+        ppm_mins = np.full(n_vars, np.nan)
+        ppm_maxs = np.full(n_vars, np.nan)
 
     else:
         # Quantification data
-        var_type = ['metabolite'] * n_vars
-        var_unit = ['mM'] * n_vars
-        descriptions = [f'Concentration of {v}' for v in var_names]
-        ppm_centers = [np.nan] * n_vars
-        ppm_mins = [np.nan] * n_vars
-        ppm_maxs = [np.nan] * n_vars
+        names = np.asarray(var_names, dtype=object)
+        var_type = 'metabolite'
+        var_unit = 'mM'
+        descriptions = 'Concentration of ' + names
+        ppm_centers = np.full(n_vars, np.nan)
+        ppm_mins = np.full(n_vars, np.nan)
+        ppm_maxs = np.full(n_vars, np.nan)
 
     variables_df = pd.DataFrame({
         'var_id': var_ids,
         'var_name': var_names,
-        'var_type': var_type,
-        'var_unit': var_unit,
+        # One repeated value each, stored as single-category columns
+        'var_type': _constant_categorical(var_type, n_vars),
+        'var_unit': _constant_categorical(var_unit, n_vars),
         'ppm_center': ppm_centers,
         'ppm_min': ppm_mins,
         'ppm_max': ppm_maxs,
-        'description': descriptions
+        # Unique strings, kept in one Arrow buffer instead of N Python objects
+        'description': pd.array(descriptions, dtype='string[pyarrow]')
     })
 
     return variables_df.set_index('var_id')
@@ -962,30 +1120,164 @@ def _generate_file_name(opts: Dict) -> str:
     return '_'.join(parts)
 
 
+# Maximum number of parquet files written at the same time
+PARQUET_WRITE_WORKERS = 4
+
+# Target uncompressed size of one parquet row group
+PARQUET_ROW_GROUP_BYTES = 128 * 1024 * 1024
+
+# Per-file ParquetWriter options. Spectral intensities never repeat, so
+# dictionary encoding only wastes a pass; byte stream splitting groups the
+# float exponent bytes together, which compresses far better.
+PARQUET_OPTS = {
+    'data': {
+        'use_dictionary': False,
+        'use_byte_stream_split': True,
+    },
+}
+
+
+def _write_parquet(
+    df: pd.DataFrame,
+    file_path: Path,
+    index: bool,
+    row_groups: Optional[List[np.ndarray]] = None,
+    **writer_opts
+):
+    """
+    Write a DataFrame to parquet one row group at a time.
+
+    Rows are converted to Arrow in row-group sized record batches and
+    streamed through a ParquetWriter, so only one chunk is ever held as
+    an Arrow copy alongside the DataFrame. ``row_groups`` optionally lists
+    the row positions of each group, in writing order; a group never
+    shares a row group with another. Extra keyword arguments are passed
+    to the ParquetWriter (default compression is snappy).
+    """
+    writer_opts.setdefault('compression', 'snappy')
+    schema = pa.Schema.from_pandas(df, preserve_index=index)
+
+    if writer_opts.get('use_byte_stream_split') is True:
+        # Restrict to float columns, string columns can't be split
+        writer_opts['use_byte_stream_split'] = [
+            field.name for field in schema if pa.types.is_floating(field.type)
+        ]
+
+    row_bytes = df.memory_usage(index=index, deep=False).sum() // max(len(df), 1)
+    chunk_rows = max(1, PARQUET_ROW_GROUP_BYTES // max(int(row_bytes), 1))
+
+    with pq.ParquetWriter(file_path, schema, **writer_opts) as writer:
+        for batch in _record_batches(df, schema, index, chunk_rows, row_groups):
+            writer.write_batch(batch)
+
+
+def _row_groups_by(labels: np.ndarray) -> List[np.ndarray]:
+    """Row positions of each distinct label, labels sorted, original order within."""
+    order = np.argsort(labels, kind='stable')
+    sorted_labels = labels[order]
+    boundaries = np.flatnonzero(sorted_labels[1:] != sorted_labels[:-1]) + 1
+    return np.split(order, boundaries)
+
+
+def _record_batches(
+    df: pd.DataFrame,
+    schema: pa.Schema,
+    index: bool,
+    chunk_rows: int,
+    row_groups: Optional[List[np.ndarray]] = None
+):
+    """
+    Yield row-group sized record batches of a DataFrame matching schema.
+
+    Wide frames holding a single float block (the data matrix) are sliced
+    straight from their numpy array: going through pandas one Series per
+    column dominates the write for 40k+ spectral columns.
+    """
+    dtypes = df.dtypes.unique()
+    matrix = None
+    if (len(dtypes) == 1 and isinstance(dtypes[0], np.dtype) and dtypes[0].kind == 'f'
+            and df.index.nlevels == 1):
+        matrix = df.to_numpy()
+
+    if row_groups is None:
+        row_groups = [slice(start, start + chunk_rows)
+                      for start in range(0, max(len(df), 1), chunk_rows)]
+    else:
+        row_groups = [rows[start:start + chunk_rows]
+                      for rows in row_groups
+                      for start in range(0, max(len(rows), 1), chunk_rows)]
+
+    # Always yield at least one (possibly empty) batch
+    for rows in row_groups:
+        if matrix is None:
+            yield pa.RecordBatch.from_pandas(df.iloc[rows], schema=schema, preserve_index=index)
+            continue
+
+        # One transposed copy per chunk so every column is contiguous
+        columns = np.ascontiguousarray(matrix[rows].T)
+        arrays = [pa.array(column) for column in columns]
+        if index:
+            index_type = schema.field(len(arrays)).type
+            arrays.append(pa.array(df.index[rows].to_numpy(), type=index_type))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _parquet_file_paths(base_name: str, output_dir: Path, keys: List[str]) -> Dict[str, Path]:
+    """Output file path of each result key, {output_dir}/{base_name}_{key}.parquet."""
+    prefix = f"{base_name}_"
+    return {key: output_dir / f"{prefix}{key}.parquet" for key in keys}
+
+
 def _write_parquet_files(
     result: Dict[str, pd.DataFrame],
     base_name: str,
     output_dir: Path,
-    log
+    log,
+    compression: str = 'zstd'
 ):
-    """Write all result DataFrames to parquet files."""
+    """Write all result DataFrames to parquet files with the given codec."""
     written_files = []
 
     log.step("Writing parquet files", LogLevel.INFO)
 
-    # Main files
-    for key in ['data', 'metadata', 'params', 'variables']:
-        if key in result:
-            file_path = output_dir / f"{base_name}_{key}.parquet"
-            result[key].to_parquet(file_path, compression='snappy', index=True)
-            log.detail(f"Wrote: {file_path.name}")
-            written_files.append((key, file_path))
+    # Per-sample files are grouped by sample type, one row group per type,
+    # so readers filtering on a type can skip the other row groups. The
+    # spcglyc region files have no sample_key and match data rows by
+    # position, so they are regrouped exactly like the data
+    sample_types = result['metadata']['sample_type']
+    row_groups = {
+        'data': _row_groups_by(sample_types.reindex(result['data'].index).to_numpy()),
+        'metadata': _row_groups_by(sample_types.to_numpy()),
+    }
+    if 'sample_key' in result['params'].index.names:
+        param_keys = result['params'].index.get_level_values('sample_key')
+        row_groups['params'] = _row_groups_by(sample_types.reindex(param_keys).to_numpy())
+
+    # Main files, then extra files (spcglyc regions)
+    main_keys = [key for key in ['data', 'metadata', 'params', 'variables'] if key in result]
+    extra_keys = [key for key in ['tsp', 'spc_region', 'glyc_region'] if key in result]
+    file_paths = _parquet_file_paths(base_name, output_dir, main_keys + extra_keys)
+
+    tasks = [
+        (key, file_paths[key],
+         dict(index=True, row_groups=row_groups.get(key), **PARQUET_OPTS.get(key, {})))
+        for key in main_keys
+    ] + [
+        (key, file_paths[key], dict(index=False, row_groups=row_groups['data']))
+        for key in extra_keys
+    ]
 
-    # Extra files (spcglyc regions)
-    for key in ['tsp', 'spc_region', 'glyc_region']:
-        if key in result:
-            file_path = output_dir / f"{base_name}_{key}.parquet"
-            result[key].to_parquet(file_path, compression='snappy', index=False)
+    # Files are independent and pyarrow releases the GIL while encoding
+    # and writing, so they are written concurrently
+    with ThreadPoolExecutor(max_workers=min(PARQUET_WRITE_WORKERS, len(tasks))) as executor:
+        futures = [
+            executor.submit(_write_parquet, result[key], file_path,
+                            compression=compression, **writer_opts)
+            for key, file_path, writer_opts in tasks
+        ]
+        # Log in file order, re-raising the first write error
+        for (key, file_path, _), future in zip(tasks, futures):
+            future.result()
             log.detail(f"Wrote: {file_path.name}")
             written_files.append((key, file_path))
 
@@ -1022,34 +1314,32 @@ def _create_duckdb_database(
         # Create or connect to database
         con = duckdb.connect(str(db_path))
 
-        # Create views for each parquet file
-        for table_name, file_path in written_files:
-            # Make table name SQL-friendly (replace hyphens with underscores)
-            sql_table_name = table_name.replace('-', '_')
-
-            # Create view pointing to parquet file
-            con.execute(f"""
-                CREATE OR REPLACE VIEW {sql_table_name} AS
-                SELECT * FROM read_parquet('{file_path}')
-            """)
-            log.detail(f"Created view: {sql_table_name}")
+        # Create views for each parquet file, all in one SQL script
+        view_names = [table_name.replace('-', '_') for table_name, _ in written_files]
+        statements = [
+            f"CREATE OR REPLACE VIEW {view_name} AS "
+            f"SELECT * FROM read_parquet('{file_path}');"
+            for view_name, (_, file_path) in zip(view_names, written_files)
+        ]
 
         # Create a convenience view that joins data with metadata
-        if any(name == 'data' for name, _ in written_files) and \
-           any(name == 'metadata' for name, _ in written_files):
-            con.execute("""
-                CREATE OR REPLACE VIEW data_with_metadata AS
-                SELECT d.*, m.*
-                FROM data d
-                LEFT JOIN metadata m USING (sample_key)
-            """)
-            log.detail("Created view: data_with_metadata")
+        if 'data' in view_names and 'metadata' in view_names:
+            statements.append(
+                "CREATE OR REPLACE VIEW data_with_metadata AS "
+                "SELECT d.*, m.* FROM data d "
+                "LEFT JOIN metadata m USING (sample_key);"
+            )
+            view_names.append('data_with_metadata')
+
+        con.execute('\n'.join(statements))
+        for view_name in view_names:
+            log.detail(f"Created view: {view_name}")
 
         con.close()
 
         log.success(f"Created DuckDB database: {db_path.name}", LogLevel.PROD)
         log.info(f"Query with: duckdb.connect('{db_path.name}')")
-        log.debug(f"Available views: {[name for name, _ in written_files] + ['data_with_metadata']}")
+        log.debug(f"Available views: {view_names}")
 
     except Exception as e:
         log.warning(f"Could not create DuckDB database: {e}")
@@ -5,7 +5,7 @@ import pandas as pd
 from pathlib import Path
 from typing import Union, Optional, Dict, Literal, TypedDict
 from dataclasses import dataclass
-from scipy.interpolate import interp1d
+from scipy.interpolate import CubicSpline
 from rich.console import Console
 
 from .parameters import read_param
@@ -20,6 +20,7 @@ class SpectrumOptions(TypedDict, total=False):
     fromTo: tuple[float, float]
     length_out: int
     im: bool
+    interp: Literal["cubic", "linear"]
 
 
 @dataclass
@@ -81,18 +82,39 @@ def read_1r(file: Union[str, Path],
 
     try:
         # Read binary data
-        spec = np.fromfile(str(file), dtype=dtype, count=number_of_points)
+        raw = np.fromfile(str(file), dtype=dtype, count=number_of_points)
 
-        # Apply power factor scaling
-        spec = (2 ** nc) * spec
+        # Power factor 2^nc, a plain shift for the usual non-negative int NC_proc
+        scale = float(1 << nc) if isinstance(nc, int) and nc >= 0 else 2.0 ** nc
 
-        return spec.astype(np.float64)
+        # Convert to float64 and apply power factor scaling in one ufunc pass
+        # (float, so large nc can't overflow int32)
+        return np.multiply(raw, scale, dtype=np.float64)
 
     except Exception as e:
         console.print(f"[red]read_1r >> Error reading {file}: {e}[/red]")
         return np.array([])
 
 
+def _regrid(x: np.ndarray, ys: np.ndarray, new_x: np.ndarray,
+            kind: Literal["cubic", "linear"] = "cubic") -> np.ndarray:
+    """
+    Interpolate every row of ys, sampled on the ascending axis x, onto new_x.
+
+    All rows share one spline fit (cubic) or one set of bracketing indices
+    and weights (linear), so regridding k rows costs little more than one.
+    Cubic extrapolates past the ends of x, linear holds the edge values
+    like np.interp.
+    """
+    if kind == 'cubic':
+        return CubicSpline(x, ys, axis=1, extrapolate=True)(new_x)
+
+    # Left neighbour of each new point and its distance to the right one
+    left = np.clip(np.searchsorted(x, new_x, side='right') - 1, 0, len(x) - 2)
+    weight = np.clip((new_x - x[left]) / (x[left + 1] - x[left]), 0.0, 1.0)
+    return ys[:, left] * (1.0 - weight) + ys[:, left + 1] * weight
+
+
 def read_spectrum(expno: Union[str, Path],
                   procno: int = 1,
                   procs: Union[bool, str, Path] = True,
@@ -126,6 +148,10 @@ def read_spectrum(expno: Union[str, Path],
             Number of points in interpolated spectrum
         - im : bool, default=False
             Read imaginary part from 1i file
+        - interp : {"cubic", "linear"}, default="cubic"
+            Interpolation onto the fromTo grid. "cubic" is a not-a-knot
+            cubic spline, extrapolated past the spectrum edges; "linear"
+            is much faster and holds the edge values outside, like np.interp.
 
     Returns
     -------
@@ -164,10 +190,14 @@ def read_spectrum(expno: Union[str, Path],
         console.print(f"[yellow]readSpectrum >> procs file not found for {expno}[/yellow]")
         return None
 
-    nc_proc = read_param(file_procs, "NC_proc")
-    if nc_proc is None:
+    # All procs parameters are read in one pass over the file
+    procs_params = read_param(
+        file_procs, ["BYTORDP", "NC_proc", "FTSIZE", "SF", "SW_p", "OFFSET", "PHC0", "PHC1"]
+    )
+    if procs_params is None or procs_params[1] is None:
         console.print(f"[yellow]readSpectrum >> empty procs file for {expno}[/yellow]")
         return None
+    bytordp, nc, size, sf, sw_p, offset, phc0, phc1 = procs_params
 
     if not file_acqus.exists():
         console.print(f"[yellow]readSpectrum >> acqus file not found for {expno}[/yellow]")
@@ -190,18 +220,8 @@ def read_spectrum(expno: Union[str, Path],
 
     uncalibrate = options.get('uncalibrate', False)
 
-    # Read important parameters
-    bytordp = read_param(file_procs, "BYTORDP")
     endian = "little" if bytordp == 0 else "big"
 
-    nc = read_param(file_procs, "NC_proc")
-    size = read_param(file_procs, "FTSIZE")
-    sf = read_param(file_procs, "SF")
-    sw_p = read_param(file_procs, "SW_p")
-    offset = read_param(file_procs, "OFFSET")
-    phc0 = read_param(file_procs, "PHC0")
-    phc1 = read_param(file_procs, "PHC1")
-
     # Check for empty parameters
     params = [endian, nc, size, sf, sw_p, offset, phc0, phc1, bf1]
     if any(p is None for p in params):
@@ -221,37 +241,29 @@ def read_spectrum(expno: Union[str, Path],
         # Removed verbose per-spectrum logging
         # console.print(f"[blue]readSpectrum >> calibration (SR) removed: {SR_p} ppm {SR} Hz[/blue]")
 
-    # Read spectrum
-    y = read_1r(file_1r, size, nc, endian)
-    y = y[::-1]  # Reverse array
+    # Read spectrum, reversed (a view, no copy)
+    y = read_1r(file_1r, size, nc, endian)[::-1]
 
-    # Compute ppm axis
-    inc = sw / (len(y) - 1)
-    x = np.arange(offset, offset - sw - inc/2, -inc)
-    x = x[::-1]  # Reverse
+    # Compute ppm axis, ascending from offset - sw to offset, one point per y
+    x = np.linspace(offset - sw, offset, len(y))
 
-    # Ensure x and y have same length
-    min_len = min(len(x), len(y))
-    x = x[:min_len]
-    y = y[:min_len]
-
-    # Read imaginary if requested
-    yi = None
+    # Real part, plus the imaginary part if requested, as rows of one array
+    # so ERETIC correction and interpolation run once over both
     if im:
-        yi = read_1r(file_1i, size, nc, endian)
-        yi = yi[::-1]
-        yi = yi[:min_len]
+        yi = read_1r(file_1i, size, nc, endian)[::-1]
 
         if len(yi) != len(y):
             console.print(f"[yellow]readSpectrum >> Im and Re have different dimensions {expno}[/yellow]")
             return None
 
-    # Apply ERETIC correction if provided
+        ys = np.stack([y, yi])
+    else:
+        ys = y[np.newaxis, :]
+
+    # Apply ERETIC correction if provided (in place, ys holds fresh arrays)
     eretic_factor = options.get('eretic')
     if eretic_factor is not None:
-        y = y / eretic_factor
-        if yi is not None:
-            yi = yi / eretic_factor
+        ys /= eretic_factor
         # Removed verbose per-spectrum logging
         # console.print(f"[blue]readSpectrum >> spectra corrected for eretic: {eretic_factor}[/blue]")
 
@@ -272,21 +284,13 @@ def read_spectrum(expno: Union[str, Path],
 
         new_x = np.linspace(from_ppm, to_ppm, length_out)
 
-        if len(x) == len(y):
-            # Interpolate using cubic spline
-            f = interp1d(x, y, kind='cubic', bounds_error=False, fill_value='extrapolate')
-            y = f(new_x)
-
-            if yi is not None:
-                f_i = interp1d(x, yi, kind='cubic', bounds_error=False, fill_value='extrapolate')
-                yi = f_i(new_x)
-        else:
-            console.print(f"[red]readSpectrum >> x and y are of different length[/red]")
-            console.print(f"[blue]readSpectrum >> {expno}[/blue]")
-            console.print(f"[blue]readSpectrum >> length(x) {len(x)}[/blue]")
-            console.print(f"[blue]readSpectrum >> length(y) {len(y)}[/blue]")
+        interp = options.get('interp', 'cubic')
+        if interp not in ('cubic', 'linear'):
+            console.print(f"[red]readSpectrum >> unknown interpolation '{interp}'[/red]")
             return None
 
+        ys = _regrid(x, ys, new_x, interp)
+
         x = new_x
         # Removed verbose per-spectrum logging - this was printing for EVERY spectrum!
         # Only print once per batch in parse_nmr instead
@@ -302,10 +306,10 @@ def read_spectrum(expno: Union[str, Path],
         uncalibrated=1 if uncalibrate else 0
     )
 
-    # Build spectrum DataFrame
-    if yi is not None:
-        spec_df = pd.DataFrame({'x': x, 'y': y, 'yi': yi})
-    else:
-        spec_df = pd.DataFrame({'x': x, 'y': y})
+    # Build spectrum DataFrame, wrapping the arrays rather than copying them
+    columns = {'x': x, 'y': ys[0]}
+    if im:
+        columns['yi'] = ys[1]
+    spec_df = pd.DataFrame(columns, copy=False)
 
     return SpectrumResult(info=info, spec=spec_df)
@@ -1,8 +1,266 @@
 """Lipoprotein calculation functions for extending raw measurements."""
 
+import os
+import re
+import time
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+
+# Publication tags that override the default "name, abbr" tag
+TAG_MAP = {
+    'TPTG': "Triglycerides, total",
+    'TPCH': "Cholesterol, total",
+    'LDCH': "Cholesterol, LDL",
+    'HDCH': "Cholesterol, HDL",
+    'TPA1': "Apo-A1, total",
+    'TPA2': "Apo-A2, total",
+    'TPAB': "Apo-B100, total",
+    'LDHD': "LDL-Chol/HDL-Chol",
+    'ABA1': "Apo-B100/Apo-A1",
+    'TBPN': "Apo-B100, particle number",
+    'VLPN': "VLDL, particle number",
+    'IDPN': "IDL, particle number",
+    'LDPN': "LDL, particle number",
+    'L1PN': "LD1, particle number",
+    'L2PN': "LD2, particle number",
+    'L3PN': "LD3, particle number",
+    'L4PN': "LD4, particle number",
+    'L5PN': "LD5, particle number",
+    'L6PN': "LD6, particle number",
+}
+
+
+# Subfraction letters and numbers, in the order the metric blocks walk them
+SUBFRACTIONS = [('H', range(1, 5)), ('V', range(1, 6)), ('L', range(1, 7))]
+
+
+def _metric_plan():
+    """
+    Spell out every derived metric computed by extend_lipo_value().
+
+    Returns ``(sums, ratios)``. ``sums`` maps each calc metric (plus the
+    subfraction CE used as numerators) to the raw ids it adds up, a leading
+    '-' subtracting. ``ratios`` maps each pct/frac metric to its
+    ``(numerator, denominator)``, each a raw id or a key of ``sums``.
+    Dict order is output column order.
+    """
+    sums = {}
+
+    # ========== CALCULATED METRICS (SUMS AND DIFFERENCES) ==========
+    # Total lipids (TL) = TG + CH + PL
+    for prefix in ['HD', 'VL', 'ID', 'LD']:
+        sums[f'{prefix}TL_calc'] = (f'{prefix}TG', f'{prefix}CH', f'{prefix}PL')
+
+    # Cholesterol esters (CE) = CH - FC
+    for prefix in ['HD', 'VL', 'ID', 'LD']:
+        sums[f'{prefix}CE_calc'] = (f'{prefix}CH', f'-{prefix}FC')
+
+    # Total particle number
+    sums['TBPN_calc'] = ('VLPN', 'IDPN') + tuple(f'L{i}PN' for i in range(1, 7))
+
+    # Apo-A1 and Apo-A2 totals
+    sums['HDA1_calc'] = tuple(f'H{i}A1' for i in range(1, 5))
+    sums['HDA2_calc'] = tuple(f'H{i}A2' for i in range(1, 5))
+
+    # LDL Apo-B
+    sums['LDAB_calc'] = tuple(f'L{i}AB' for i in range(1, 7))
+
+    # Subfraction total lipids
+    for letter, rng in [('V', range(1, 6)), ('L', range(1, 7)), ('H', range(1, 5))]:
+        for i in rng:
+            sums[f'{letter}{i}TL_calc'] = (f'{letter}{i}TG', f'{letter}{i}CH', f'{letter}{i}PL')
+
+    # Subfraction CE = CH - FC (numerators only, not part of the output)
+    for letter, rng in SUBFRACTIONS:
+        for i in rng:
+            sums[f'{letter}{i}CE'] = (f'{letter}{i}CH', f'-{letter}{i}FC')
+
+    ratios = {}
+
+    # ========== PERCENTAGE METRICS (COMPOSITION) ==========
+    # Main fraction CE percentages
+    for prefix in ['HD', 'VL', 'ID', 'LD']:
+        ratios[f'{prefix}CE_pct'] = (f'{prefix}CE_calc', f'{prefix}TL_calc')
+
+    # Particle number percentages
+    ratios['VLPN_pct'] = ('VLPN', 'TBPN_calc')
+    ratios['IDPN_pct'] = ('IDPN', 'TBPN_calc')
+
+    # Subfraction CE percentages
+    for letter, rng in SUBFRACTIONS:
+        for i in rng:
+            ratios[f'{letter}{i}CE_pct'] = (f'{letter}{i}CE', f'{letter}{i}TL_calc')
+
+    # Subfraction component percentages (TG, FC, PL as % of TL)
+    for letter, rng in SUBFRACTIONS:
+        for i in rng:
+            for suffix in ['TG', 'FC', 'PL']:
+                ratios[f'{letter}{i}{suffix}_pct'] = (f'{letter}{i}{suffix}', f'{letter}{i}TL_calc')
+
+    # Main fraction component percentages
+    for prefix in ['HD', 'VL', 'ID', 'LD']:
+        for suffix in ['TG', 'CH', 'FC', 'PL']:
+            ratios[f'{prefix}{suffix}_pct'] = (f'{prefix}{suffix}', f'{prefix}TL_calc')
+
+    # ========== FRACTIONAL METRICS (DISTRIBUTION) ==========
+    # Subfraction CE as fraction of main fraction CE
+    main_fraction = {'H': 'HD', 'V': 'VL', 'L': 'LD'}
+    for letter, rng in SUBFRACTIONS:
+        for i in rng:
+            ratios[f'{letter}{i}CE_frac'] = (f'{letter}{i}CE', f'{main_fraction[letter]}CE_calc')
+
+    # Subfraction components as fraction of main fraction components
+    # Note: Uses raw data in denominator (not calc), as per R code comments.
+    # Each prefix overwrites the previous one, so 'LD' is the denominator kept.
+    for letter, rng in SUBFRACTIONS:
+        for i in rng:
+            for suffix in ['TG', 'CH', 'FC', 'PL']:
+                for prefix in ['HD', 'VL', 'LD']:  # Skip 'ID'
+                    ratios[f'{letter}{i}{suffix}_frac'] = (f'{letter}{i}{suffix}', f'{prefix}{suffix}')
+
+    # HDL Apo fractions
+    for i in range(1, 5):
+        for suffix in ['A1', 'A2']:
+            ratios[f'H{i}{suffix}_frac'] = (f'H{i}{suffix}', f'HD{suffix}_calc')
+
+    # LDL Apo-B and particle number fractions
+    for i in range(1, 7):
+        ratios[f'L{i}AB_frac'] = (f'L{i}AB', 'LDAB_calc')
+        ratios[f'L{i}PN_frac'] = (f'L{i}PN', 'TBPN_calc')
+
+    return sums, ratios
+
+
+SUMS, RATIOS = _metric_plan()
+
+# Raw ids the derived metrics are computed from, in the column order of the
+# matrix handed to _derived_metrics()
+RAW_IDS = sorted(
+    {term.lstrip('-') for terms in SUMS.values() for term in terms}
+    | {operand for pair in RATIOS.values() for operand in pair if operand not in SUMS}
+)
+
+# Output columns: the calc metrics, then the pct and frac ratios, with
+# their slots in the derived block
+CALC_IDS = [name for name in SUMS if name.endswith('_calc')]
+DERIVED_IDS = CALC_IDS + list(RATIOS)
+DERIVED_INDEX = pd.Index(DERIVED_IDS)
+
+# Suffix of a derived id, stripped to find the raw id it came from
+DERIVED_SUFFIX_RE = re.compile(r'_(?:calc|pct|frac)')
+CALC_SLOTS = slice(0, len(CALC_IDS))
+RATIO_SLOTS = slice(len(CALC_IDS), len(DERIVED_IDS))
+
+
+def _index_plan():
+    """
+    Turn SUMS and RATIOS into integer column indices.
+
+    Sum terms index into ``[raw values | negated raw values]``, so a
+    subtracted term is just another column. Sums are grouped by their number
+    of terms so each group is added term by term, left to right, in the same
+    order as the formulas. Ratio operands index into the pool
+    ``[raw values | sums]``.
+    """
+    n_raw = len(RAW_IDS)
+    pool = {name: i for i, name in enumerate(RAW_IDS + list(SUMS))}
+
+    groups = {}
+    for pos, terms in enumerate(SUMS.values()):
+        groups.setdefault(len(terms), []).append((pos, terms))
+
+    sum_groups = []
+    for members in groups.values():
+        positions = np.array([pos for pos, _ in members])
+        # Term-major (n_terms, n_sums): each term position is one contiguous
+        # index stream
+        idx = np.ascontiguousarray(np.array([
+            [pool[t[1:]] + n_raw if t.startswith('-') else pool[t] for t in terms]
+            for _, terms in members
+        ]).T)
+        sum_groups.append((positions, idx))
+
+    num_idx = np.array([pool[num] for num, _ in RATIOS.values()])
+    den_idx = np.array([pool[den] for _, den in RATIOS.values()])
+    return sum_groups, num_idx, den_idx
+
+
+SUM_GROUPS, NUM_IDX, DEN_IDX = _index_plan()
+
+
+def _derived_metrics(vals: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute all derived metrics for a (n_rows, len(RAW_IDS)) value matrix.
+
+    Writes into ``out``, a (n_rows, len(DERIVED_IDS)) array (or view),
+    allocated when not given: calc sums at CALC_SLOTS, then the pct/frac
+    ratios, rounded to 4 decimals and scaled to percent, at RATIO_SLOTS.
+    A single (len(RAW_IDS),) vector gives a (len(DERIVED_IDS),) result.
+    Pure NumPy, the pandas side stays in the callers. Returns ``out``.
+    """
+    if out is None:
+        out = np.empty(vals.shape[:-1] + (len(DERIVED_IDS),))
+    vals = np.atleast_2d(vals)
+    rows = np.atleast_2d(out)
+
+    n_raw = len(RAW_IDS)
+    pool = np.empty((vals.shape[0], n_raw + len(SUMS)))
+    pool[:, :n_raw] = vals
+
+    # One gather per group, (n_rows, n_terms, n_sums), then a running total
+    # over the terms (a + -b is exactly a - b)
+    signed = np.hstack([vals, -vals])
+    sums = pool[:, n_raw:]
+    for positions, idx in SUM_GROUPS:
+        terms = signed[:, idx]
+        acc = terms[:, 0]
+        for j in range(1, idx.shape[0]):
+            acc += terms[:, j]
+        sums[:, positions] = acc
+    rows[:, CALC_SLOTS] = sums[:, :len(CALC_IDS)]
+
+    ratios = rows[:, RATIO_SLOTS]
+    np.divide(pool[:, NUM_IDX], pool[:, DEN_IDX], out=ratios)
+    np.round(ratios, 4, out=ratios)
+    ratios *= 100
+
+    return out
+
+
+def _raw_positions(ids: pd.Index) -> np.ndarray:
+    """Positions of RAW_IDS in ids, raising KeyError for any that are missing."""
+    positions = ids.get_indexer(RAW_IDS)
+    if (positions < 0).any():
+        missing = [raw_id for raw_id, pos in zip(RAW_IDS, positions) if pos < 0]
+        raise KeyError(f"{missing} not in lipo data")
+    return positions
+
+
+def _no_clock() -> float:
+    """Stand-in for time.perf_counter when DEBUG_TIMING is off."""
+    return 0.0
+
+
+def _validate_lipo(lipo: Dict[str, Any], required_cols=('id', 'value')) -> None:
+    """Check that lipo is read_lipo() output with the required data columns."""
+    if not isinstance(lipo, dict):
+        raise TypeError(f"lipo must be a dict, got {type(lipo).__name__}")
+
+    if 'data' not in lipo:
+        raise ValueError("lipo dict must contain 'data' key")
+
+    if not isinstance(lipo['data'], pd.DataFrame):
+        raise TypeError(f"lipo['data'] must be a DataFrame, got {type(lipo['data']).__name__}. "
+                       "Note: extend_lipo() only works with read_lipo() output, not read_experiment() output.")
+
+    # Check for required columns
+    missing_cols = [col for col in required_cols if col not in lipo['data'].columns]
+    if missing_cols:
+        raise ValueError(f"lipo['data'] missing required columns: {missing_cols}. "
+                        "Note: extend_lipo() expects long-format data from read_lipo(), "
+                        "not wide-format data from read_experiment().")
 
 
 def extend_lipo_value(lipo: Dict[str, Any]) -> pd.DataFrame:
@@ -55,170 +313,33 @@ def extend_lipo_value(lipo: Dict[str, Any]) -> pd.DataFrame:
     >>> extended = extend_lipo_value(stacked_lipo)
     >>> extended.shape  # (3, 316) - one row per input
     """
-    # Validate input structure
-    if not isinstance(lipo, dict):
-        raise TypeError(f"lipo must be a dict, got {type(lipo).__name__}")
+    _validate_lipo(lipo)
 
-    if 'data' not in lipo:
-        raise ValueError("lipo dict must contain 'data' key")
+    # One row per _row_num (or per repeat of an id), one column per id, both
+    # in sorted order as a pivot would give them
+    # Support multiple rows: use existing _row_num if present, otherwise use cumcount
+    data = lipo['data']
+    if '_row_num' in data.columns:
+        row_num = data['_row_num']
+    else:
+        row_num = data.groupby('id').cumcount()
+    row_ix, row_labels = pd.factorize(row_num, sort=True)
+    col_ix, col_labels = pd.factorize(data['id'], sort=True)
+    n_rows, n_cols = len(row_labels), len(col_labels)
 
-    if not isinstance(lipo['data'], pd.DataFrame):
-        raise TypeError(f"lipo['data'] must be a DataFrame, got {type(lipo['data']).__name__}. "
-                       "Note: extend_lipo() only works with read_lipo() output, not read_experiment() output.")
+    cells = row_ix * n_cols + col_ix
+    if len(np.unique(cells)) != len(cells):
+        raise ValueError("Index contains duplicate entries, cannot reshape")
 
-    # Check for required columns
-    required_cols = ['id', 'value']
-    missing_cols = [col for col in required_cols if col not in lipo['data'].columns]
-    if missing_cols:
-        raise ValueError(f"lipo['data'] missing required columns: {missing_cols}. "
-                        "Note: extend_lipo() expects long-format data from read_lipo(), "
-                        "not wide-format data from read_experiment().")
+    # Original values plus all derived metrics, one row per input row, filled
+    # in place: raw values scattered straight into their cells (missing ones
+    # NaN), then the derived block at fixed slots
+    out = np.empty((n_rows, n_cols + len(DERIVED_IDS)))
+    out[:, :n_cols] = np.nan
+    out[row_ix, col_ix] = data['value'].to_numpy(dtype=np.float64)
+    _derived_metrics(out[:, _raw_positions(col_labels)], out[:, n_cols:])
 
-    # Create DataFrame with IDs as columns
-    # Support multiple rows: use existing _row_num if present, otherwise use cumcount
-    if '_row_num' in lipo['data'].columns:
-        df = lipo['data'].pivot(index='_row_num', columns='id', values='value')
-    else:
-        data_with_index = lipo['data'].copy()
-        data_with_index['_row_num'] = data_with_index.groupby('id').cumcount()
-        df = data_with_index.pivot(index='_row_num', columns='id', values='value')
-
-    # Process each row (supports multiple rows for batch processing)
-    all_results = []
-
-    for row_idx in range(len(df)):
-        row = df.iloc[row_idx]
-
-        # Initialize result dictionaries
-        calc = {}
-        pct = {}
-        frac = {}
-
-        # ========== CALCULATED METRICS (SUMS AND DIFFERENCES) ==========
-        # Total lipids (TL) = TG + CH + PL
-        calc['HDTL'] = row['HDTG'] + row['HDCH'] + row['HDPL']
-        calc['VLTL'] = row['VLTG'] + row['VLCH'] + row['VLPL']
-        calc['IDTL'] = row['IDTG'] + row['IDCH'] + row['IDPL']
-        calc['LDTL'] = row['LDTG'] + row['LDCH'] + row['LDPL']
-
-        # Cholesterol esters (CE) = CH - FC
-        calc['HDCE'] = row['HDCH'] - row['HDFC']
-        calc['VLCE'] = row['VLCH'] - row['VLFC']
-        calc['IDCE'] = row['IDCH'] - row['IDFC']
-        calc['LDCE'] = row['LDCH'] - row['LDFC']
-
-        # Total particle number
-        calc['TBPN'] = row['VLPN'] + row['IDPN'] + row['L1PN'] + row['L2PN'] + row['L3PN'] + row['L4PN'] + row['L5PN'] + row['L6PN']
-
-        # Apo-A1 and Apo-A2 totals
-        calc['HDA1'] = row['H1A1'] + row['H2A1'] + row['H3A1'] + row['H4A1']
-        calc['HDA2'] = row['H1A2'] + row['H2A2'] + row['H3A2'] + row['H4A2']
-
-        # LDL Apo-B
-        calc['LDAB'] = row['L1AB'] + row['L2AB'] + row['L3AB'] + row['L4AB'] + row['L5AB'] + row['L6AB']
-
-        # Subfraction total lipids
-        for letter, rng in [('V', range(1, 6)), ('L', range(1, 7)), ('H', range(1, 5))]:
-            for i in rng:
-                calc[f'{letter}{i}TL'] = row[f'{letter}{i}TG'] + row[f'{letter}{i}CH'] + row[f'{letter}{i}PL']
-
-        # ========== PERCENTAGE METRICS (COMPOSITION) ==========
-        # Main fraction CE percentages
-        pct['HDCE'] = np.round(calc['HDCE'] / calc['HDTL'], 4) * 100
-        pct['VLCE'] = np.round(calc['VLCE'] / calc['VLTL'], 4) * 100
-        pct['IDCE'] = np.round(calc['IDCE'] / calc['IDTL'], 4) * 100
-        pct['LDCE'] = np.round(calc['LDCE'] / calc['LDTL'], 4) * 100
-
-        # Particle number percentages
-        pct['VLPN'] = np.round(row['VLPN'] / calc['TBPN'], 4) * 100
-        pct['IDPN'] = np.round(row['IDPN'] / calc['TBPN'], 4) * 100
-
-        # Subfraction CE percentages
-        for letter, rng in [('H', range(1, 5)), ('V', range(1, 6)), ('L', range(1, 7))]:
-            for i in rng:
-                ch_col = f'{letter}{i}CH'
-                fc_col = f'{letter}{i}FC'
-                ce_col = f'{letter}{i}CE'
-                tl_col = f'{letter}{i}TL'
-                pct[ce_col] = np.round((row[ch_col] - row[fc_col]) / calc[tl_col], 4) * 100
-
-        # Subfraction component percentages (TG, FC, PL as % of TL)
-        for letter, rng in [('H', range(1, 5)), ('V', range(1, 6)), ('L', range(1, 7))]:
-            for i in rng:
-                tl_col = f'{letter}{i}TL'
-                for suffix in ['TG', 'FC', 'PL']:
-                    col = f'{letter}{i}{suffix}'
-                    pct[col] = np.round(row[col] / calc[tl_col], 4) * 100
-
-        # Main fraction component percentages
-        for prefix in ['HD', 'VL', 'ID', 'LD']:
-            tl_col = f'{prefix}TL'
-            for suffix in ['TG', 'CH', 'FC', 'PL']:
-                col = f'{prefix}{suffix}'
-                pct[col] = np.round(row[col] / calc[tl_col], 4) * 100
-
-        # ========== FRACTIONAL METRICS (DISTRIBUTION) ==========
-        # Subfraction CE as fraction of main fraction CE
-        for letter, rng in [('H', range(1, 5)), ('V', range(1, 6)), ('L', range(1, 7))]:
-            for i in rng:
-                ch_col = f'{letter}{i}CH'
-                fc_col = f'{letter}{i}FC'
-                ce_col = f'{letter}{i}CE'
-
-                # Determine denominator
-                if letter == 'V':
-                    denom = 'VLCE'
-                elif letter == 'H':
-                    denom = 'HDCE'
-                else:  # letter == 'L'
-                    denom = 'LDCE'
-
-                frac[ce_col] = np.round((row[ch_col] - row[fc_col]) / calc[denom], 4) * 100
-
-        # Subfraction components as fraction of main fraction components
-        # Note: Uses raw data in denominator (not calc), as per R code comments
-        for letter, rng in [('H', range(1, 5)), ('V', range(1, 6)), ('L', range(1, 7))]:
-            for i in rng:
-                for suffix in ['TG', 'CH', 'FC', 'PL']:
-                    for prefix in ['HD', 'VL', 'LD']:  # Skip 'ID'
-                        col = f'{letter}{i}{suffix}'
-                        denom_col = f'{prefix}{suffix}'
-                        frac[col] = np.round(row[col] / row[denom_col], 4) * 100
-
-        # HDL Apo fractions
-        for i in range(1, 5):
-            for suffix in ['A1', 'A2']:
-                col = f'H{i}{suffix}'
-                denom = f'HD{suffix}'
-                frac[col] = np.round(row[col] / calc[denom], 4) * 100
-
-        # LDL Apo-B and particle number fractions
-        for i in range(1, 7):
-            # Apo-B fraction
-            col = f'L{i}AB'
-            frac[col] = np.round(row[col] / calc['LDAB'], 4) * 100
-
-            # Particle number fraction
-            col = f'L{i}PN'
-            frac[col] = np.round(row[col] / calc['TBPN'], 4) * 100
-
-        # Convert to Series for easier concatenation
-        calc_series = pd.Series(calc, name=row_idx)
-        pct_series = pd.Series(pct, name=row_idx)
-        frac_series = pd.Series(frac, name=row_idx)
-
-        # Rename columns with suffixes
-        calc_series.index = [f'{idx}_calc' for idx in calc_series.index]
-        pct_series.index = [f'{idx}_pct' for idx in pct_series.index]
-        frac_series.index = [f'{idx}_frac' for idx in frac_series.index]
-
-        # Combine all metrics for this row
-        row_result = pd.concat([row, calc_series, pct_series, frac_series])
-        all_results.append(row_result)
-
-    # Combine all rows into DataFrame
-    result = pd.DataFrame(all_results)
-    return result
+    return pd.DataFrame(out, columns=col_labels.append(DERIVED_INDEX), copy=False)
 
 
 def extend_lipo(lipo: Dict[str, Any]) -> Dict[str, Any]:
@@ -258,11 +379,11 @@ def extend_lipo(lipo: Dict[str, Any]) -> Dict[str, Any]:
 
     Implementation Details
     ----------------------
-    1. Stacks value, refMax, refMin into single DataFrame (3 rows)
-    2. Calls extend_lipo_value() once for all three (batch processing)
-    3. Transforms wide format to long format with pivot/melt
+    1. Stacks value, refMax, refMin of the raw ids into one (3, n) matrix
+    2. Computes the derived metrics for all three in one kernel pass
+    3. Orders the derived reference ranges and builds the long format
     4. Fills metadata using vectorized pandas operations (no loops!)
-    5. Adds reference ranges, publication tags, and formatting
+    5. Adds publication tags and formatting
 
     Examples
     --------
@@ -276,216 +397,130 @@ def extend_lipo(lipo: Dict[str, Any]) -> Dict[str, Any]:
     >>> os.environ['DEBUG_TIMING'] = '1'
     >>> extended = extend_lipo(lipo)  # Prints detailed timing breakdown
     """
-    import time
+    # Step timing only when DEBUG_TIMING is set, otherwise a no-op clock
+    debug_timing = bool(os.environ.get('DEBUG_TIMING'))
+    clock = time.perf_counter if debug_timing else _no_clock
     timings = {}
-    t_start = time.perf_counter()
-
-    # Stack all three columns (value, refMax, refMin) for batch processing
-    # We assign each a row number (0, 1, 2) so extend_lipo_value processes them together
-    stacked_rows = []
-    for row_idx, col_name in enumerate(['value', 'refMax', 'refMin']):
-        for _, row in lipo['data'].iterrows():
-            stacked_rows.append({
-                'id': row['id'],
-                'value': row[col_name],
-                '_row_num': row_idx
-            })
-
-    stacked_df = pd.DataFrame(stacked_rows)
-    timings['1_stacking'] = (time.perf_counter() - t_start) * 1000
-
-    # Process all three rows at once (value, refMax, refMin)
-    t1 = time.perf_counter()
-    lipo_stacked = {'data': stacked_df, 'version': lipo['version']}
-    df_extended_all = extend_lipo_value(lipo_stacked)  # Returns 3 rows x 316 cols
-    timings['2_extend_lipo_value'] = (time.perf_counter() - t1) * 1000
-
-    # Separate back into value, refMax, refMin
-    t2 = time.perf_counter()
-    df_extended = df_extended_all.iloc[[0]]  # Row 0 = values
-    df_refmax = df_extended_all.iloc[[1]]    # Row 1 = refMax
-    df_refmin = df_extended_all.iloc[[2]]    # Row 2 = refMin
-    timings['3_separate_rows'] = (time.perf_counter() - t2) * 1000
-
-    # Melt the wide format to long format
-    t3 = time.perf_counter()
-    extended_long = df_extended.T.reset_index()
-    extended_long.columns = ['id', 'value']
-    timings['4_melt_to_long'] = (time.perf_counter() - t3) * 1000
-
-    # Match with original data to get metadata
-    t4 = time.perf_counter()
-    original_df = lipo['data'].set_index('id')
+    t_start = clock()
 
-    # Initialize result DataFrame
-    result = pd.DataFrame()
-    result['id'] = extended_long['id']
-    result['value'] = extended_long['value']
-    timings['5_init_result'] = (time.perf_counter() - t4) * 1000
-
-    # Get metadata from original data where available
-    t5 = time.perf_counter()
-    result['fraction'] = result['id'].map(lambda x: original_df.loc[x, 'fraction'] if x in original_df.index else None)
-    result['name'] = result['id'].map(lambda x: original_df.loc[x, 'name'] if x in original_df.index else None)
-    result['abbr'] = result['id'].map(lambda x: original_df.loc[x, 'abbr'] if x in original_df.index else None)
-    result['type'] = result['id'].map(lambda x: original_df.loc[x, 'type'] if x in original_df.index else None)
-    result['unit'] = result['id'].map(lambda x: original_df.loc[x, 'unit'] if x in original_df.index else None)
-    result['refMax'] = result['id'].map(lambda x: original_df.loc[x, 'refMax'] if x in original_df.index else None)
-    result['refMin'] = result['id'].map(lambda x: original_df.loc[x, 'refMin'] if x in original_df.index else None)
-    result['refUnit'] = result['id'].map(lambda x: original_df.loc[x, 'refUnit'] if x in original_df.index else None)
-    timings['6_map_metadata'] = (time.perf_counter() - t5) * 1000
-
-    # Set reference ranges for derived metrics from wide DataFrames
-    # FULLY VECTORIZED: No loops!
-    t6 = time.perf_counter()
-
-    # Convert wide DataFrames to Series
-    refmax_series = df_refmax.iloc[0]
-    refmin_series = df_refmin.iloc[0]
-
-    # Create masks for derived metrics (those not in original data)
-    is_derived = ~result['id'].isin(original_df.index)
-
-    # Map all derived IDs to their refMax/refMin values at once
-    derived_ids = result.loc[is_derived, 'id']
-    ref_max_values = derived_ids.map(refmax_series)
-    ref_min_values = derived_ids.map(refmin_series)
-
-    # Set refMax as the larger value, refMin as smaller
-    result.loc[is_derived, 'refMax'] = ref_max_values.combine(ref_min_values, lambda x, y: max(x, y) if pd.notna(x) and pd.notna(y) else x)
-    result.loc[is_derived, 'refMin'] = ref_max_values.combine(ref_min_values, lambda x, y: min(x, y) if pd.notna(x) and pd.notna(y) else y)
-
-    timings['7_set_ref_ranges'] = (time.perf_counter() - t6) * 1000
+    _validate_lipo(lipo, required_cols=['id', 'value', 'refMax', 'refMin'])
+
+    # value, refMax and refMin of every raw id as the three rows of one
+    # matrix, so all derived metrics come out of a single kernel pass
+    bounds = ['value', 'refMax', 'refMin']
+    # (the id-indexed frame is built once and reused for all metadata lookups)
+    original_df = lipo['data'].set_index('id')
+    by_id = original_df[bounds].to_numpy(dtype=np.float64).T
+    order = np.argsort(original_df.index.to_numpy(), kind='stable')
+    raw_ids = original_df.index[order]
+    raw = by_id[:, order]
+    vals = by_id[:, _raw_positions(original_df.index)]
+    timings['1_stacking'] = (clock() - t_start) * 1000
+
+    # Raw values first, then the derived block (rows: value, refMax, refMin)
+    t1 = clock()
+    n_raw = len(raw_ids)
+    extended = np.empty((3, n_raw + len(DERIVED_IDS)))
+    extended[:, :n_raw] = raw
+    _derived_metrics(vals, extended[:, n_raw:])
+    timings['2_derived_metrics'] = (clock() - t1) * 1000
+
+    # Set reference ranges for derived metrics: refMax as the larger value,
+    # refMin as smaller; where either bound is missing each keeps its own value
+    t2 = clock()
+    ref_max_values = extended[1, n_raw:]
+    ref_min_values = extended[2, n_raw:]
+    both = ~np.isnan(ref_max_values) & ~np.isnan(ref_min_values)
+    extended[1, n_raw:], extended[2, n_raw:] = (
+        np.where(both, np.maximum(ref_max_values, ref_min_values), ref_max_values),
+        np.where(both, np.minimum(ref_max_values, ref_min_values), ref_min_values),
+    )
+    timings['3_set_ref_ranges'] = (clock() - t2) * 1000
+
+    # Long format: one row per raw or derived id, metadata from the original
+    # data by one hashed reindex on id (derived ids get NaN)
+    t3 = clock()
+    ids = raw_ids.append(DERIVED_INDEX)
+    meta_cols = ['fraction', 'name', 'abbr', 'type', 'unit', 'refUnit']
+    result = pd.DataFrame({'id': ids, 'value': extended[0]})
+    result[meta_cols] = original_df.reindex(ids)[meta_cols].reset_index(drop=True)
+    result['refMax'] = extended[1]
+    result['refMin'] = extended[2]
+    timings['4_init_result'] = (clock() - t3) * 1000
 
     # Fill missing metadata for derived metrics
     # Fraction: Try to match from base ID - VECTORIZED
-    t7 = time.perf_counter()
-
-    # Get mask of missing fractions
-    missing_fraction = result['fraction'].isna()
-
-    # Create base_id column for lookup
-    result.loc[missing_fraction, 'base_id'] = (
-        result.loc[missing_fraction, 'id']
-        .str.replace('CE', 'CH')
-        .str.replace('_calc', '')
-        .str.replace('_pct', '')
-        .str.replace('_frac', '')
-        .str[:4]
+    t4 = clock()
+
+    # Base ids for lookup: derived suffix stripped, cut to the 4-char raw id,
+    # with CE looked up as CH (and, for abbr, TL as TG)
+    ids = result['id']
+    # (the swaps keep the length, so cutting to 4 chars first is equivalent)
+    base = ids.str.replace(DERIVED_SUFFIX_RE, '', regex=True).str[:4]
+    base_ch = base.str.replace('CE', 'CH', regex=False)
+    base_tg = base.str.replace('TL', 'TG', regex=False)
+    has_ce = ids.str.contains('CE', regex=False, na=False)
+    has_tl = ids.str.contains('TL', regex=False, na=False)
+
+    # Prefix map (first 2 chars -> fraction of the first raw id with that prefix)
+    first_of_prefix = original_df.loc[~original_df.index.str[:2].duplicated(), 'fraction']
+    prefix_map = pd.Series(first_of_prefix.to_numpy(), index=first_of_prefix.index.str[:2])
+
+    # Map from base_id to fraction, then fall back to prefix matching
+    result['fraction'] = (
+        result['fraction']
+        .fillna(base_ch.map(original_df['fraction']))
+        .fillna(ids.str[:2].map(prefix_map))
+    )
+
+    timings['5_fill_fraction'] = (clock() - t4) * 1000
+
+    # Name: Specific names for CE and TL metrics, otherwise from base ID - VECTORIZED
+    t5 = clock()
+
+    derived_name = np.where(
+        has_ce, "Cholesterol Ester",
+        np.where(has_tl, "Triglycerides, Cholesterol, Phospholipids",
+                 ids.str[:4].map(original_df['name']).to_numpy(dtype=object))
     )
+    result['name'] = result['name'].fillna(pd.Series(derived_name, index=result.index))
+
+    timings['6_fill_name'] = (clock() - t5) * 1000
+
+    # Abbreviation: Match from CE->CH replacement, then TL->TG - VECTORIZED
+    t6 = clock()
 
-    # Map from base_id to fraction
-    result.loc[missing_fraction, 'fraction'] = result.loc[missing_fraction, 'base_id'].map(
-        lambda x: original_df.loc[x, 'fraction'] if x in original_df.index else None
+    # For CE metrics, replace -Chol with -CE
+    abbr_ch = base_ch.map(original_df['abbr'])
+    abbr_ch = abbr_ch.mask(has_ce, abbr_ch.str.replace('-Chol', '-CE', regex=False))
+
+    result['abbr'] = (
+        result['abbr']
+        .fillna(abbr_ch)
+        .fillna(base_tg.map(original_df['abbr']))
     )
 
-    # For still-missing, try prefix matching
-    still_missing = result['fraction'].isna()
-    if still_missing.any():
-        # Create a prefix map (first 2 chars -> fraction)
-        prefix_map = {}
-        for idx in original_df.index:
-            prefix = idx[:2]
-            if prefix not in prefix_map:
-                prefix_map[prefix] = original_df.loc[idx, 'fraction']
-
-        result.loc[still_missing, 'fraction'] = result.loc[still_missing, 'id'].str[:2].map(prefix_map)
-
-    # Clean up temporary column
-    result.drop(columns=['base_id'], inplace=True, errors='ignore')
-
-    timings['8_fill_fraction'] = (time.perf_counter() - t7) * 1000
-
-    # Name: Set specific names for CE and TL metrics - VECTORIZED
-    t8 = time.perf_counter()
-
-    missing_name = result['name'].isna()
-
-    # Set CE names
-    is_ce = missing_name & result['id'].str.contains('CE', na=False)
-    result.loc[is_ce, 'name'] = "Cholesterol Ester"
-
-    # Set TL names
-    is_tl = missing_name & result['id'].str.contains('TL', na=False) & ~is_ce
-    result.loc[is_tl, 'name'] = "Triglycerides, Cholesterol, Phospholipids"
-
-    # For remaining, map from base ID
-    still_missing = result['name'].isna()
-    if still_missing.any():
-        base_ids = result.loc[still_missing, 'id'].str[:4]
-        result.loc[still_missing, 'name'] = base_ids.map(
-            lambda x: original_df.loc[x, 'name'] if x in original_df.index else None
-        )
-
-    timings['9_fill_name'] = (time.perf_counter() - t8) * 1000
-
-    # Abbreviation: Match from CE->CH replacement - VECTORIZED
-    t9 = time.perf_counter()
-
-    missing_abbr = result['abbr'].isna()
-
-    if missing_abbr.any():
-        # Create base_id for lookup (CE->CH replacement)
-        base_ids = (
-            result.loc[missing_abbr, 'id']
-            .str.replace('CE', 'CH')
-            .str.replace('_calc', '')
-            .str.replace('_pct', '')
-            .str.replace('_frac', '')
-            .str[:4]
-        )
-
-        # Map abbreviations
-        abbrs = base_ids.map(lambda x: original_df.loc[x, 'abbr'] if x in original_df.index else None)
-
-        # For CE metrics, replace -Chol with -CE
-        is_ce = result.loc[missing_abbr, 'id'].str.contains('CE', na=False)
-        abbrs.loc[is_ce] = abbrs.loc[is_ce].str.replace('-Chol', '-CE', regex=False)
-
-        result.loc[missing_abbr, 'abbr'] = abbrs
-
-        # For still missing, try TL->TG replacement
-        still_missing = result['abbr'].isna()
-        if still_missing.any():
-            base_ids_tg = (
-                result.loc[still_missing, 'id']
-                .str.replace('TL', 'TG')
-                .str.replace('_calc', '')
-                .str.replace('_pct', '')
-                .str.replace('_frac', '')
-                .str[:4]
-            )
-            result.loc[still_missing, 'abbr'] = base_ids_tg.map(
-                lambda x: original_df.loc[x, 'abbr'] if x in original_df.index else None
-            )
-
-    timings['10_fill_abbr'] = (time.perf_counter() - t9) * 1000
+    timings['7_fill_abbr'] = (clock() - t6) * 1000
 
     # Type: Set all derived metrics as "prediction"
-    t10 = time.perf_counter()
+    t7 = clock()
     result['type'] = result['type'].fillna('prediction')
-    timings['11_fill_type'] = (time.perf_counter() - t10) * 1000
+    timings['8_fill_type'] = (clock() - t7) * 1000
 
     # Unit: Set units for calc metrics - VECTORIZED
-    t11 = time.perf_counter()
-
-    missing_unit = result['unit'].isna()
-
-    # For _calc metrics
-    is_calc = missing_unit & result['id'].str.contains('_calc', na=False)
-    result.loc[is_calc, 'unit'] = 'mg/dL'
-
-    # Special case: TBPN_calc
-    result.loc[result['id'] == 'TBPN_calc', 'unit'] = 'nmol/L'
+    t8 = clock()
 
-    # For other derived metrics (pct, frac)
-    is_other = missing_unit & ~is_calc
-    result.loc[is_other, 'unit'] = '-/-'
+    # _calc metrics are mg/dL (TBPN_calc a particle count in nmol/L), other
+    # derived metrics (pct, frac) are unitless
+    is_calc = result['id'].str.endswith('_calc')
+    derived_unit = np.where(is_calc, 'mg/dL', '-/-').astype(object)
+    derived_unit[(result['id'] == 'TBPN_calc').to_numpy()] = 'nmol/L'
+    result['unit'] = result['unit'].fillna(pd.Series(derived_unit, index=result.index))
 
-    timings['12_fill_unit'] = (time.perf_counter() - t11) * 1000
+    timings['9_fill_unit'] = (clock() - t8) * 1000
 
     # RefUnit: Same as unit
-    t12 = time.perf_counter()
+    t9 = clock()
     result['refUnit'] = result['unit']
 
     # Correct typo in XML (row 9 should be Apo-B100 / Apo-A1)
@@ -493,46 +528,28 @@ def extend_lipo(lipo: Dict[str, Any]) -> Dict[str, Any]:
         result.loc[8, 'name'] = "Apo-B100 / Apo-A1"
 
     # Clean abbreviations (remove spaces)
-    result['abbr'] = result['abbr'].str.replace(' ', '')
-    timings['13_cleanup'] = (time.perf_counter() - t12) * 1000
+    result['abbr'] = result['abbr'].str.replace(' ', '', regex=False)
+    timings['10_cleanup'] = (clock() - t9) * 1000
 
     # Create publication tags
-    t13 = time.perf_counter()
+    t10 = clock()
     result['tag'] = result['name'] + ', ' + result['abbr']
 
-    # Special tags for common parameters
-    result.loc[result['id'].str.contains('TPTG'), 'tag'] = "Triglycerides, total"
-    result.loc[result['id'].str.contains('TPCH'), 'tag'] = "Cholesterol, total"
-    result.loc[result['id'].str.contains('LDCH'), 'tag'] = "Cholesterol, LDL"
-    result.loc[result['id'].str.contains('HDCH'), 'tag'] = "Cholesterol, HDL"
-    result.loc[result['id'].str.contains('TPA1'), 'tag'] = "Apo-A1, total"
-    result.loc[result['id'].str.contains('TPA2'), 'tag'] = "Apo-A2, total"
-    result.loc[result['id'].str.contains('TPAB'), 'tag'] = "Apo-B100, total"
-    result.loc[result['id'].str.contains('LDHD'), 'tag'] = "LDL-Chol/HDL-Chol"
-    result.loc[result['id'].str.contains('ABA1'), 'tag'] = "Apo-B100/Apo-A1"
-    result.loc[result['id'].str.contains('TBPN'), 'tag'] = "Apo-B100, particle number"
-    result.loc[result['id'].str.contains('VLPN'), 'tag'] = "VLDL, particle number"
-    result.loc[result['id'].str.contains('IDPN'), 'tag'] = "IDL, particle number"
-    result.loc[result['id'].str.contains('LDPN'), 'tag'] = "LDL, particle number"
-    result.loc[result['id'].str.contains('L1PN'), 'tag'] = "LD1, particle number"
-    result.loc[result['id'].str.contains('L2PN'), 'tag'] = "LD2, particle number"
-    result.loc[result['id'].str.contains('L3PN'), 'tag'] = "LD3, particle number"
-    result.loc[result['id'].str.contains('L4PN'), 'tag'] = "LD4, particle number"
-    result.loc[result['id'].str.contains('L5PN'), 'tag'] = "LD5, particle number"
-    result.loc[result['id'].str.contains('L6PN'), 'tag'] = "LD6, particle number"
-    timings['14_create_tags'] = (time.perf_counter() - t13) * 1000
+    # Special tags for common parameters (keyed by the 4-char raw id, which
+    # derived ids keep ahead of their _calc/_pct/_frac suffix)
+    result['tag'] = result['id'].str[:4].map(TAG_MAP).fillna(result['tag'])
+    timings['11_create_tags'] = (clock() - t10) * 1000
 
     # Reorder columns
-    t14 = time.perf_counter()
+    t11 = clock()
     result = result[['fraction', 'name', 'abbr', 'id', 'type', 'value',
                      'unit', 'refMax', 'refMin', 'refUnit', 'tag']]
-    timings['15_reorder_columns'] = (time.perf_counter() - t14) * 1000
+    timings['12_reorder_columns'] = (clock() - t11) * 1000
 
-    timings['TOTAL'] = (time.perf_counter() - t_start) * 1000
+    timings['TOTAL'] = (clock() - t_start) * 1000
 
     # Optional: Print detailed timing (set DEBUG_TIMING env var to enable)
-    import os
-    if os.environ.get('DEBUG_TIMING'):
+    if debug_timing:
         print("\n" + "="*60)
         print("DETAILED TIMING BREAKDOWN (extend_lipo)")
         print("="*60)
@@ -1,9 +1,40 @@
 """Utility functions for data processing."""
 
 import re
+from functools import lru_cache
 from typing import Union, List
 
 
+# Patterns used by clean_names, compiled once
+WHITESPACE_RE = re.compile(r'\s+')
+TRAILING_ASTERISK_RE = re.compile(r'\*$')
+NON_WORD_RE = re.compile(r'[^\w#]+')
+
+
+@lru_cache(maxsize=4096)
+def _clean_name(name: str) -> str:
+    """
+    Clean a single name (see clean_names), without the uniqueness suffix.
+
+    Cached: the same experiment names, pulse programs and instruments come
+    up for every folder scanned.
+    """
+    # Remove backslashes, normalize whitespace to single spaces and trim,
+    # then convert to lowercase
+    name = WHITESPACE_RE.sub(' ', name.replace("\\", " ")).strip(' ').lower()
+
+    # Handle special characters
+    # Trailing asterisk becomes -s
+    name = TRAILING_ASTERISK_RE.sub('-s', name)
+    # Other asterisks become t, plus signs become p
+    name = name.replace('*', 't').replace('+', 'p')
+
+    # Replace every run of characters other than alphanumerics and # (kept
+    # for replicates), dashes and spaces included, by a single dash, then
+    # remove leading and trailing dashes
+    return NON_WORD_RE.sub('-', name).strip('-')
+
+
 def clean_names(names: Union[str, List[str]]) -> Union[str, List[str]]:
     """
     Clean names for importation into databases.
@@ -37,57 +68,19 @@ def clean_names(names: Union[str, List[str]]) -> Union[str, List[str]]:
     if is_single:
         names = [names]
 
-    cleaned = []
-    for name in names:
-        # Remove backslashes
-        name = name.replace("\\", " ")
-
-        # Remove trailing spaces
-        name = re.sub(r'\s+$', '', name)
-
-        # Remove leading spaces
-        name = re.sub(r'^\s+', '', name)
-
-        # Remove double spaces
-        name = re.sub(r'\s+', ' ', name)
-
-        # Convert to lowercase
-        name = name.lower()
-
-        # Handle special characters
-        # Trailing asterisk becomes -s
-        name = re.sub(r'\*$', '-s', name)
-        # Other asterisks become t
-        name = re.sub(r'\*', 't', name)
-        # Plus signs become p
-        name = re.sub(r'\+', 'p', name)
-
-        # Remove all except alphanumeric and # (for replicates)
-        # Keep # but replace other non-alphanumeric chars (including spaces) with dash
-        name = re.sub(r'[^\w#]', '-', name)
-
-        # Collapse multiple dashes
-        name = re.sub(r'-+', '-', name)
-
-        # Remove leading dash
-        name = re.sub(r'^-', '', name)
-
-        # Remove trailing dashes
-        name = re.sub(r'-*$', '', name)
-
-        cleaned.append(name)
+    # Clean each distinct name once; repeats reuse the result
+    distinct = {name: _clean_name(name) for name in dict.fromkeys(names)}
+    cleaned = [distinct[name] for name in names]
 
     # Make names unique by appending #1, #2, etc. for duplicates
     # (similar to R's make.unique function)
+    # (one dict probe per name: count of earlier occurrences, -1 if none)
     seen = {}
     result = []
     for name in cleaned:
-        if name in seen:
-            seen[name] += 1
-            result.append(f"{name}#{seen[name]}")
-        else:
-            seen[name] = 0
-            result.append(name)
+        count = seen.get(name, -1) + 1
+        seen[name] = count
+        result.append(f"{name}#{count}" if count else name)
 
     # Return in same format as input
     if is_single:
@@ -2,15 +2,54 @@
 
 import pandas as pd
 from pathlib import Path
-from functools import lru_cache
+from functools import cache
 from typing import Literal
 
 
 # Data directory path
 DATA_DIR = Path(__file__).parent / "data"
 
+# QC report read for each matrix type, with the label used in error messages
+QC_REPORTS = {
+    "SER": ("Plasma", "plasma_qc_report_2.xml"),
+    "URI": ("Urine", "urine_qc_report.xml"),
+}
+
+# Columns returned by get_qc_table, plus the measurement ones for with_value
+QC_COLUMNS = ['name', 'type', 'unit', 'refMax', 'refMin']
+QC_VALUE_COLUMNS = ['value', 'comment']
+
+# Quantification report read for each matrix type, serum shares the plasma one
+SM_REPORTS = {
+    "SER": "plasma_quant_report.xml",
+    "PLA": "plasma_quant_report.xml",
+    "URI": "urine_quant_report_e.xml",
+}
+
+
+@cache
+def _lipo_table(extended: bool, with_densities: bool) -> pd.DataFrame:
+    """Parse the lipoprotein report, see get_lipo_table()."""
+    from nmr_parser.xml_parsers.lipoproteins import read_lipo
+
+    xml_path = DATA_DIR / "lipo_results.xml"
+
+    if not xml_path.exists():
+        raise FileNotFoundError(
+            f"Lipoprotein reference data not found: {xml_path}"
+        )
+
+    lipo = read_lipo(xml_path)
+    if lipo is None:
+        raise ValueError(f"Failed to read lipoprotein data from {xml_path}")
+
+    if extended:
+        from nmr_parser.processing.lipoprotein_calc import extend_lipo
+        return extend_lipo(lipo)['data']
+
+    return lipo['data']
+
 
-@lru_cache(maxsize=1)
 def get_lipo_table(extended: bool = False, with_densities: bool = False) -> pd.DataFrame:
     """
     Get lipoprotein reference table.
@@ -28,7 +67,9 @@ def get_lipo_table(extended: bool = False, with_densities: bool = False) -> pd.D
     Returns
     -------
     pd.DataFrame
-        DataFrame with lipoprotein measurements and reference ranges
+        DataFrame with lipoprotein measurements and reference ranges.
+        The frame is cached and shared between calls, copy it before
+        modifying it in place.
 
     Examples
     --------
@@ -36,30 +77,32 @@ def get_lipo_table(extended: bool = False, with_densities: bool = False) -> pd.D
     >>> lipo = get_lipo_table()
     >>> lipo[['id', 'value', 'unit']].head()
     """
-    from nmr_parser.xml_parsers.lipoproteins import read_lipo
+    return _lipo_table(bool(extended), bool(with_densities))
 
-    xml_path = DATA_DIR / "lipo_results.xml"
+
+@cache
+def _qc_table(matrix_type: str, with_value: bool) -> pd.DataFrame:
+    """Parse the QC report of one matrix type, see get_qc_table()."""
+    from nmr_parser.xml_parsers.quality_control import read_qc
+
+    label, file_name = QC_REPORTS[matrix_type]
+    xml_path = DATA_DIR / file_name
 
     if not xml_path.exists():
         raise FileNotFoundError(
-            f"Lipoprotein reference data not found: {xml_path}"
+            f"{label} QC reference data not found: {xml_path}"
         )
 
-    lipo = read_lipo(xml_path)
-    if lipo is None:
-        raise ValueError(f"Failed to read lipoprotein data from {xml_path}")
-
-    df = lipo['data'].copy()
-
-    if extended:
-        from nmr_parser.processing.lipoprotein_calc import extend_lipo
-        result = extend_lipo(lipo)
-        df = result['data']
+    qc = read_qc(xml_path)
+    if qc is None:
+        raise ValueError(f"Failed to read QC data from {xml_path}")
 
-    return df
+    # Build the frame from the returned columns only
+    tests = qc['data']['tests']
+    columns = QC_COLUMNS + QC_VALUE_COLUMNS if with_value else QC_COLUMNS
+    return pd.DataFrame({col: tests[col] for col in columns})
 
 
-@lru_cache(maxsize=1)
 def get_qc_table(matrix_type: Literal["SER", "URI"] = "SER",
                  with_value: bool = False) -> pd.DataFrame:
     """
@@ -72,7 +115,7 @@ def get_qc_table(matrix_type: Literal["SER", "URI"] = "SER",
     Parameters
     ----------
     matrix_type : {"SER", "URI"}, default="SER"
-        Sample matrix type:
+        Sample matrix type, case-insensitive:
         - "SER": Serum/Plasma
         - "URI": Urine
     with_value : bool, default=False
@@ -100,46 +143,11 @@ def get_qc_table(matrix_type: Literal["SER", "URI"] = "SER",
     >>> qc_uri = get_qc_table("URI")
     >>> qc_uri[['name', 'refMin', 'refMax']].head()
     """
-    from nmr_parser.xml_parsers.quality_control import read_qc
-
-    if matrix_type == "SER":
-        xml_path = DATA_DIR / "plasma_qc_report_2.xml"
-
-        if not xml_path.exists():
-            raise FileNotFoundError(
-                f"Plasma QC reference data not found: {xml_path}"
-            )
-
-        qc = read_qc(xml_path)
-        if qc is None:
-            raise ValueError(f"Failed to read QC data from {xml_path}")
-
-        df = pd.DataFrame(qc['data']['tests'])
-
-    else:  # URI
-        xml_path = DATA_DIR / "urine_qc_report.xml"
-
-        if not xml_path.exists():
-            raise FileNotFoundError(
-                f"Urine QC reference data not found: {xml_path}"
-            )
-
-        qc = read_qc(xml_path)
-        if qc is None:
-            raise ValueError(f"Failed to read QC data from {xml_path}")
-
-        df = pd.DataFrame(qc['data']['tests'])
+    matrix_type = "SER" if matrix_type.upper() == "SER" else "URI"
+    return _qc_table(matrix_type, bool(with_value))
 
-    # Select columns to return
-    if with_value:
-        df = df[['name', 'type', 'unit', 'refMax', 'refMin', 'value', 'comment']]
-    else:
-        df = df[['name', 'type', 'unit', 'refMax', 'refMin']]
 
-    return df
-
-
-@lru_cache(maxsize=1)
+@cache
 def get_pacs_table() -> pd.DataFrame:
     """
     Get PACS (Phenotypic Assessment and Clinical Screening) reference table.
@@ -199,17 +207,37 @@ def get_pacs_table() -> pd.DataFrame:
     if pacs is None:
         raise ValueError(f"Failed to read PACS data from {xml_path}")
 
-    # Extract dataframe and rename columns to match R function output
-    tbl = pacs['data'].copy()
-    tbl.columns = ['name', 'conc', 'unit', 'refMax', 'refMin', 'refUnit']
+    # Wrap the reference columns under the R function's names (drop conc),
+    # in one constructor pass
+    src = pacs['data']
+    return pd.DataFrame({
+        'name': src.iloc[:, 0].array,
+        'unit': src.iloc[:, 2].array,
+        'refMax': src.iloc[:, 3].array,
+        'refMin': src.iloc[:, 4].array,
+        'refUnit': src.iloc[:, 5].array,
+    }, copy=False)
+
+
+@cache
+def _sm_table(file_name: str) -> pd.DataFrame:
+    """Parse one quantification report, see get_sm_table()."""
+    from nmr_parser.xml_parsers.quantification import read_quant
 
-    # Return only the reference columns (drop conc)
-    tbl = tbl[['name', 'unit', 'refMax', 'refMin', 'refUnit']]
+    xml_path = DATA_DIR / file_name
 
-    return tbl
+    if not xml_path.exists():
+        raise FileNotFoundError(
+            f"Small molecule reference data not found: {xml_path}"
+        )
+
+    quant = read_quant(xml_path)
+    if quant is None:
+        raise ValueError(f"Failed to read quantification data from {xml_path}")
+
+    return quant['data']
 
 
-@lru_cache(maxsize=1)
 def get_sm_table(matrix_type: Literal["SER", "PLA", "URI"] = "SER") -> pd.DataFrame:
     """
     Get small molecules (metabolites) reference table.
@@ -219,7 +247,7 @@ def get_sm_table(matrix_type: Literal["SER", "PLA", "URI"] = "SER") -> pd.DataFr
     Parameters
     ----------
     matrix_type : {"SER", "PLA", "URI"}, default="SER"
-        Sample matrix type:
+        Sample matrix type, case-insensitive:
         - "SER": Serum (uses plasma data)
         - "PLA": Plasma
         - "URI": Urine
@@ -227,7 +255,9 @@ def get_sm_table(matrix_type: Literal["SER", "PLA", "URI"] = "SER") -> pd.DataFr
     Returns
     -------
     pd.DataFrame
-        DataFrame with metabolite data including reference ranges
+        DataFrame with metabolite data including reference ranges.
+        The frame is cached and shared between calls, copy it before
+        modifying it in place.
 
     Examples
     --------
@@ -240,34 +270,19 @@ def get_sm_table(matrix_type: Literal["SER", "PLA", "URI"] = "SER") -> pd.DataFr
     >>> len(sm_uri)
     150
     """
-    from nmr_parser.xml_parsers.quantification import read_quant
-
-    if matrix_type in ["SER", "PLA"]:
-        xml_path = DATA_DIR / "plasma_quant_report.xml"
-    else:  # URI
-        xml_path = DATA_DIR / "urine_quant_report_e.xml"
-
-    if not xml_path.exists():
-        raise FileNotFoundError(
-            f"Small molecule reference data not found: {xml_path}"
-        )
-
-    quant = read_quant(xml_path)
-    if quant is None:
-        raise ValueError(f"Failed to read quantification data from {xml_path}")
-
-    return quant['data'].copy()
+    file_name = SM_REPORTS.get(matrix_type.upper(), SM_REPORTS["URI"])
+    return _sm_table(file_name)
 
 
 # Alias for backwards compatibility
 def getLipoTable(extended: bool = False, withDensities: bool = False) -> pd.DataFrame:
     """Alias for get_lipo_table() with R-style naming."""
-    return get_lipo_table(extended=extended, with_densities=withDensities)
+    return get_lipo_table(extended, withDensities)
 
 
 def getQcTable(matrixType: str = "SER", withValue: bool = False) -> pd.DataFrame:
     """Alias for get_qc_table() with R-style naming."""
-    return get_qc_table(matrix_type=matrixType, with_value=withValue)
+    return get_qc_table(matrixType, withValue)
 
 
 def getPacsTable() -> pd.DataFrame:
@@ -277,4 +292,4 @@ def getPacsTable() -> pd.DataFrame:
 
 def getSmTable(matrixType: str = "SER") -> pd.DataFrame:
     """Alias for get_sm_table() with R-style naming."""
-    return get_sm_table(matrix_type=matrixType)
+    return get_sm_table(matrixType)
@@ -65,3 +65,16 @@ class TestReadExperiment:
         }
         result = read_experiment(covid_sample_10, opts=opts)
         assert 'spec' in result
+
+    def test_parallel_read_matches_serial(self, covid_sample_10, covid_sample_11):
+        """Test that reading with several workers keeps results and order."""
+        if not covid_sample_10.exists() or not covid_sample_11.exists():
+            pytest.skip("Test data not available")
+
+        paths = [covid_sample_11, covid_sample_10]
+        serial = read_experiment(paths, opts={"what": ["acqus", "qc"], "nWorkers": 1})
+        parallel = read_experiment(paths, opts={"what": ["acqus", "qc"], "nWorkers": 4})
+
+        assert parallel['acqus']['path'].tolist() == [str(p) for p in paths]
+        assert parallel['acqus'].equals(serial['acqus'])
+        assert parallel['qc'].equals(serial['qc'])
@@ -8,6 +8,7 @@ import pytest
 import numpy as np
 import pandas as pd
 from pathlib import Path
+import sys
 import tempfile
 import shutil
 
@@ -15,7 +16,14 @@ from nmr_parser.core.parse_nmr import (
     _classify_sample_types,
     _make_unique,
     _calculate_spcglyc,
+    _merge_data_sources,
     _generate_sample_keys,
+    _ppm_slice,
+    _integrate_regions,
+    _write_parquet,
+    _write_parquet_files,
+    _row_groups_by,
+    PARQUET_OPTS,
 )
 from nmr_parser.core.logger import get_logger
 
@@ -113,6 +121,19 @@ class TestSampleTypeClassification:
         assert result.loc[1, 'sampleType'] == 'sample'
         assert result.loc[2, 'sampleType'] == 'sample'
 
+    def test_3mm_tube_flag(self):
+        """Test that 3mm tubes are flagged from the data path, ignoring case."""
+        loe = pd.DataFrame({
+            'dataPath': ['run_3mm/10', 'run_3MM/10', 'run/10'],
+            'sampleID': ['s1', 's2', 's3'],
+            'sampleType': ['sample'] * 3,
+            'experiment': ['exp'] * 3
+        })
+
+        result = _classify_sample_types(loe, test_logger)
+
+        assert result['is3mm'].tolist() == [True, True, False]
+
 
 class TestMakeUnique:
     """Test unique name generation."""
@@ -206,6 +227,21 @@ class TestSpcglycCalculations:
         # After flip correction, all values should be positive
         assert np.all(data_matrix >= 0), "Some values are negative after flip correction"
 
+    def test_flip_matches_upright_spectra(self):
+        """Test that flipped spectra give the same results as upright ones."""
+        spectra, ppm = self.create_test_spectrum(n_samples=8)
+        loe = pd.DataFrame({'dataPath': [f'path{i}' for i in range(8)]})
+        upright = _calculate_spcglyc(spectra, ppm, loe, test_logger)
+
+        # Turn every other spectrum upside down, flip correction must undo it
+        flipped = spectra.copy()
+        flipped[::2] *= -1
+        data_matrix, var_names, extra = _calculate_spcglyc(flipped, ppm, loe, test_logger)
+
+        np.testing.assert_array_equal(data_matrix, upright[0])
+        for name in ('spc_region', 'glyc_region'):
+            pd.testing.assert_frame_equal(extra[name], upright[2][name])
+
     def test_biomarker_ranges(self):
         """Test that biomarkers are calculated from correct PPM ranges."""
         spectra, ppm = self.create_test_spectrum(n_samples=1)
@@ -277,6 +313,73 @@ class TestSpcglycCalculations:
         assert all(2.050 < p < 2.118 for p in glyc_ppm), "Glyc region has wrong PPM range"
 
 
+class TestPpmSlice:
+    """Test binary-search region lookup used by spcglyc."""
+
+    def test_matches_boolean_masks(self):
+        """Test that slices select exactly what the R-style masks select."""
+        ppm = np.linspace(-0.1, 10, 44079)
+
+        for ppm_min, ppm_max in [(3.18, 3.32), (2.050, 2.118), (0.2, 0.7), (6.0, 10.0), (4.6, 4.85)]:
+            strict = (ppm > ppm_min) & (ppm < ppm_max)
+            inclusive = (ppm >= ppm_min) & (ppm <= ppm_max)
+
+            assert np.array_equal(ppm[_ppm_slice(ppm, ppm_min, ppm_max)], ppm[strict])
+            assert np.array_equal(
+                ppm[_ppm_slice(ppm, ppm_min, ppm_max, inclusive=True)], ppm[inclusive]
+            )
+
+    def test_fused_integration_matches_masks(self):
+        """Test that the single-pass integration equals per-region masked sums."""
+        ppm = np.linspace(-0.1, 10, 5000)
+        spectra = np.random.default_rng(0).standard_normal((3, len(ppm)))
+        bounds = [(3.18, 3.32), (3.262, 3.3), (3.2, 3.236), (2.050, 2.118),
+                  (6.0, 10.0), (11.0, 12.0)]
+
+        sums = _integrate_regions(spectra, ppm, bounds)
+
+        for i, (ppm_min, ppm_max) in enumerate(bounds):
+            mask = (ppm > ppm_min) & (ppm < ppm_max)
+            np.testing.assert_allclose(sums[:, i], spectra[:, mask].sum(axis=1), atol=1e-9)
+
+    def test_descending_axis_rejected(self):
+        """Test that spcglyc refuses a descending ppm axis."""
+        ppm = np.linspace(10, -0.1, 1000)
+        spectra = np.ones((1, len(ppm)))
+        loe = pd.DataFrame({'dataPath': ['path1']})
+
+        with pytest.raises(ValueError):
+            _calculate_spcglyc(spectra, ppm, loe, test_logger)
+
+
+class TestMergeDataSources:
+    """Test path intersection of the data matrix with acqus and QC."""
+
+    def make_loe(self, n):
+        return pd.DataFrame({'dataPath': [f'p{i}' for i in range(n)]})
+
+    def test_rows_follow_intersection(self):
+        """Test that samples missing acqus are dropped with their matrix rows."""
+        data_matrix = np.arange(5.0)[:, None] * np.ones((1, 3))
+        acqus = pd.DataFrame({'path': ['p0', 'p1', 'p2', 'p3']})
+
+        matrix, loe, acqus, qc = _merge_data_sources(
+            data_matrix, self.make_loe(5), acqus, None, test_logger
+        )
+
+        assert loe['dataPath'].tolist() == ['p0', 'p1', 'p2', 'p3']
+        np.testing.assert_array_equal(matrix[:, 0], [0.0, 1.0, 2.0, 3.0])
+
+    def test_misaligned_matrix_rejected(self):
+        """Test that a matrix with a missing row is not paired with the wrong samples."""
+        # Spectrum of p2 failed to read, acqus of p4 is missing
+        data_matrix = np.array([0.0, 1.0, 3.0, 4.0])[:, None] * np.ones((1, 3))
+        acqus = pd.DataFrame({'path': ['p0', 'p1', 'p2', 'p3']})
+
+        with pytest.raises(ValueError, match="cannot align"):
+            _merge_data_sources(data_matrix, self.make_loe(5), acqus, None, test_logger)
+
+
 class TestSampleKeys:
     """Test sample key generation."""
 
@@ -308,6 +411,138 @@ class TestSampleKeys:
         assert len(parts[-1]) == 8, "Hash is not 8 characters"
 
 
+class TestParquetWriting:
+    """Test chunked parquet output."""
+
+    def test_round_trip_in_several_row_groups(self, tmp_path, monkeypatch):
+        """Test that streamed row groups read back as the original frame."""
+        import pyarrow.parquet as pq
+
+        df = pd.DataFrame(
+            np.random.default_rng(0).standard_normal((10, 4)),
+            columns=['0.1', '0.2', '0.3', '0.4']
+        )
+        df.insert(0, 'sample_key', [f'key_{i}' for i in range(10)])
+        df = df.set_index('sample_key')
+
+        # Force roughly three rows per row group
+        monkeypatch.setattr(
+            sys.modules['nmr_parser.core.parse_nmr'], 'PARQUET_ROW_GROUP_BYTES', 3 * 4 * 8
+        )
+        file_path = tmp_path / 'data.parquet'
+        _write_parquet(df, file_path, index=True)
+
+        assert pq.ParquetFile(file_path).num_row_groups > 1
+        pd.testing.assert_frame_equal(pd.read_parquet(file_path), df)
+
+    def test_data_options_round_trip(self, tmp_path):
+        """Test that float32 data written with byte stream split reads back exactly."""
+        import pyarrow.parquet as pq
+
+        df = pd.DataFrame(
+            np.random.default_rng(0).standard_normal((5, 3)).astype(np.float32),
+            columns=['0.1', '0.2', '0.3'],
+            index=pd.Index([f'key_{i}' for i in range(5)], name='sample_key')
+        )
+        file_path = tmp_path / 'data.parquet'
+        _write_parquet(df, file_path, index=True, **PARQUET_OPTS['data'])
+
+        column = pq.ParquetFile(file_path).metadata.row_group(0).column(0)
+        assert 'BYTE_STREAM_SPLIT' in column.encodings
+        pd.testing.assert_frame_equal(pd.read_parquet(file_path), df)
+
+    def test_row_group_per_sample_type(self, tmp_path):
+        """Test that each sample type lands in its own row group, in order."""
+        import pyarrow.parquet as pq
+
+        df = pd.DataFrame({
+            'sample_type': ['sample', 'ltr', 'sample', 'pqc', 'ltr'],
+            'value': [0.0, 1.0, 2.0, 3.0, 4.0],
+        }, index=pd.Index(['a', 'b', 'c', 'd', 'e'], name='sample_key'))
+        file_path = tmp_path / 'metadata.parquet'
+        _write_parquet(
+            df, file_path, index=True,
+            row_groups=_row_groups_by(df['sample_type'].to_numpy())
+        )
+
+        metadata = pq.ParquetFile(file_path).metadata
+        assert metadata.num_row_groups == 3
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(0).statistics
+            assert stats.min == stats.max
+
+        written = pd.read_parquet(file_path)
+        assert written.index.tolist() == ['b', 'e', 'd', 'a', 'c']
+        pd.testing.assert_frame_equal(written.sort_index(), df)
+
+    def test_region_files_stay_row_aligned(self, tmp_path):
+        """Test that spcglyc region files are regrouped like data (mixed sample types)."""
+        keys = pd.Index(['a', 'b', 'c', 'd', 'e'], name='sample_key')
+        data = pd.DataFrame({'SPC_All': [0.0, 1.0, 2.0, 3.0, 4.0]}, index=keys)
+        region = pd.DataFrame({'3.2': [0.0, 10.0, 20.0, 30.0, 40.0],
+                               '3.3': [0.5, 10.5, 20.5, 30.5, 40.5]})
+        result = {
+            'data': data,
+            'metadata': pd.DataFrame(
+                {'sample_type': ['sample', 'ltr', 'sample', 'pqc', 'ltr']}, index=keys
+            ),
+            'params': pd.DataFrame({'value': ['1', '2']}),
+            'tsp': region * 2,
+            'spc_region': region,
+            'glyc_region': region + 1,
+        }
+        _write_parquet_files(result, 'run', tmp_path, test_logger)
+
+        written_data = pd.read_parquet(tmp_path / 'run_data.parquet')
+        written_metadata = pd.read_parquet(tmp_path / 'run_metadata.parquet')
+        assert written_data.index.tolist() == ['b', 'e', 'd', 'a', 'c']
+        assert written_metadata.index.tolist() == written_data.index.tolist()
+
+        positions = [keys.get_loc(key) for key in written_data.index]
+        for key in ['tsp', 'spc_region', 'glyc_region']:
+            written = pd.read_parquet(tmp_path / f'run_{key}.parquet')
+            expected = result[key].iloc[positions].reset_index(drop=True)
+            pd.testing.assert_frame_equal(written, expected)
+
+    def test_categorical_round_trip(self, tmp_path):
+        """Test that categorical metadata columns read back as categories."""
+        df = pd.DataFrame({
+            'method': pd.Categorical(['brxlipo'] * 4),
+            'value': [0.0, 1.0, 2.0, 3.0],
+        }, index=pd.Index(['a', 'b', 'c', 'd'], name='sample_key'))
+        file_path = tmp_path / 'metadata.parquet'
+        _write_parquet(df, file_path, index=True)
+
+        pd.testing.assert_frame_equal(pd.read_parquet(file_path), df)
+
+    def test_string_only_round_trip(self, tmp_path):
+        """Test that a frame of only string columns (e.g. params) is written."""
+        df = pd.DataFrame({
+            'path': pd.array(['a/10', 'b/10'], dtype='string'),
+            'value': pd.array(['600.27', '600.31'], dtype='string'),
+        })
+        file_path = tmp_path / 'params.parquet'
+        _write_parquet(df, file_path, index=False)
+
+        pd.testing.assert_frame_equal(pd.read_parquet(file_path), df)
+
+    def test_categorical_only_round_trip(self, tmp_path):
+        """Test that a frame of only categorical columns is written."""
+        df = pd.DataFrame({'method': pd.Categorical(['brxlipo', 'brxpacs'])})
+        file_path = tmp_path / 'metadata.parquet'
+        _write_parquet(df, file_path, index=False)
+
+        pd.testing.assert_frame_equal(pd.read_parquet(file_path), df)
+
+    def test_empty_frame(self, tmp_path):
+        """Test that an empty frame still produces a readable file."""
+        df = pd.DataFrame({'a': pd.Series([], dtype=float)})
+        file_path = tmp_path / 'empty.parquet'
+        _write_parquet(df, file_path, index=False)
+
+        assert len(pd.read_parquet(file_path)) == 0
+
+
 class TestIntegration:
     """Integration tests for full pipeline (when test data available)."""
 
@@ -63,7 +63,16 @@ class TestReferenceTables:
         try:
             lipo1 = get_lipo_table()
             lipo2 = get_lipo_table()
-            # Should be the same object due to @lru_cache
+            # Should be the same object due to caching
             assert lipo1 is lipo2
         except FileNotFoundError:
             pytest.skip("Reference data CSV not available")
+
+    def test_sm_table_matrix_types_share_cache(self):
+        """Test that serum, plasma and lower-case names share one parse."""
+        try:
+            assert get_sm_table("SER") is get_sm_table("PLA")
+            assert get_sm_table("ser") is get_sm_table("SER")
+            assert get_lipo_table() is get_lipo_table(extended=False)
+        except FileNotFoundError:
+            pytest.skip("Reference data CSV not available")
@@ -65,6 +65,23 @@ class TestReadSpectrum:
         assert spec.spec['x'].min() >= -0.1
         assert spec.spec['x'].max() <= 10
 
+    def test_linear_interpolation(self, covid_sample_10):
+        """Test that linear regridding lands close to the cubic spline."""
+        if not covid_sample_10.exists():
+            pytest.skip("Test data not available")
+
+        opts = {'fromTo': (-0.1, 10), 'length_out': 44079}
+        cubic = read_spectrum(covid_sample_10, options=opts)
+        linear = read_spectrum(covid_sample_10, options={**opts, 'interp': 'linear'})
+
+        if cubic is None or linear is None:
+            pytest.skip("Spectrum reading failed")
+
+        assert len(linear.spec) == 44079
+        np.testing.assert_array_equal(linear.spec['x'], cubic.spec['x'])
+        y_range = np.ptp(cubic.spec['y'])
+        assert np.abs(linear.spec['y'] - cubic.spec['y']).max() < 0.05 * y_range
+
     def test_spectrum_with_eretic(self, covid_sample_10):
         """Test spectrum with ERETIC correction."""
         if not covid_sample_10.exists():